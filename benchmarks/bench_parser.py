@@ -0,0 +1,113 @@
+"""
+Benchmark do parser (leitura em bytes vs. descodificação completa)
+
+Mede o tempo de parse de uma playlist grande com:
+    1. parse_m3u8(), que usa a leitura em bytes (mmap) para ficheiros
+       não comprimidos e só descodifica a pasta e o nome de cada track
+    2. A leitura em texto (todo o ficheiro descodificado linha a linha),
+       usada para ficheiros comprimidos e como alternativa
+
+As duas leituras são comparadas para garantir que dão o mesmo resultado.
+
+Uso:
+    python benchmarks/bench_parser.py [--tracks N] [--runs N]
+
+Os resultados de referência estão registados em benchmarks/README.md.
+
+Autor: Vinyl Playlist Parser
+Versão: 1.0
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Diretório raiz do projeto (onde estão parser.py, cli.py, etc.)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from parser import _decode_entries, _open_binary, parse_m3u8
+
+
+def write_sample_playlist(path: str, track_count: int, encoding: str) -> None:
+    """
+    Cria uma playlist de exemplo para o benchmark.
+
+    Args:
+        path (str): Caminho do ficheiro a criar
+        track_count (int): Número de tracks da playlist
+        encoding (str): Encoding do ficheiro (ex.: "utf-8", "windows-1252")
+    """
+    with open(path, "w", encoding=encoding) as f:
+        f.write("#EXTM3U\n")
+        for i in range(track_count):
+            f.write(f"#EXTINF:300,Artista {i} - A1) Canção {i}\n")
+            f.write(f"/música/Vinyl Rips/Artista {i // 10} [K{i:03d}] (2000)/A1) Canção {i}.flac\n")
+
+
+def read_as_text(path: str) -> list:
+    """
+    Lê a playlist descodificando o ficheiro inteiro (sem a leitura em bytes).
+
+    Args:
+        path (str): Caminho da playlist
+
+    Returns:
+        list: Tracks como (folder, filename)
+    """
+    return list(_decode_entries(
+        lambda: _open_binary(path, None), path, os.path.dirname(path), True
+    ))
+
+
+def median_time_s(function, runs: int) -> float:
+    """
+    Mede a mediana do tempo de execução de uma função.
+
+    Args:
+        function (Callable): Função sem argumentos
+        runs (int): Número de execuções
+
+    Returns:
+        float: Mediana do tempo de execução, em segundos
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    """
+    Corre o benchmark e imprime os resultados.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--tracks", type=int, default=1_000_000, help="Tracks da playlist")
+    arg_parser.add_argument("--runs", type=int, default=3, help="Execuções por medição")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for encoding in ("utf-8", "windows-1252"):
+            playlist = os.path.join(temp_dir, f"sample_{encoding}.m3u8")
+            write_sample_playlist(playlist, args.tracks, encoding)
+
+            if parse_m3u8(playlist) != read_as_text(playlist):
+                raise RuntimeError(f"Resultados diferentes para {encoding}")
+
+            size_mb = os.path.getsize(playlist) / (1 << 20)
+            bytes_s = median_time_s(lambda: parse_m3u8(playlist), args.runs)
+            text_s = median_time_s(lambda: read_as_text(playlist), args.runs)
+
+            print(f"{encoding} ({args.tracks} tracks, {size_mb:.0f} MB, "
+                  f"mediana de {args.runs} execuções):")
+            print(f"  leitura em bytes  {bytes_s:6.2f} s  ({size_mb / bytes_s:6.1f} MB/s)")
+            print(f"  leitura em texto  {text_s:6.2f} s  ({size_mb / text_s:6.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark do tempo de arranque (modo headless vs. interface gráfica)
+
+Mede, em processos Python novos (arranque a frio do interpretador):
+    1. O tempo de importação de cada ponto de entrada, com
+       ``python -X importtime`` (tempo cumulativo do módulo, em ms)
+    2. O tempo total de converter uma playlist com o cli.py, comparado com
+       o tempo de apenas importar a interface gráfica (gui.py)
+
+Uso:
+    python benchmarks/bench_startup.py [--runs N]
+
+Os resultados de referência estão registados em benchmarks/README.md.
+
+Autor: Vinyl Playlist Parser
+Versão: 1.0
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Diretório raiz do projeto (onde estão cli.py, gui.py, etc.)
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time_ms(module: str) -> float:
+    """
+    Mede o tempo cumulativo de importação de um módulo com -X importtime.
+
+    Args:
+        module (str): Nome do módulo a importar (ex.: "cli")
+
+    Returns:
+        float: Tempo cumulativo de importação, em milissegundos
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    # Formato de cada linha: "import time: self [us] | cumulative | nome"
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"Módulo {module} não encontrado na saída de -X importtime")
+
+
+def wall_time_ms(command: list, runs: int) -> float:
+    """
+    Mede a mediana do tempo total de execução de um comando.
+
+    Args:
+        command (list): Comando a executar
+        runs (int): Número de execuções
+
+    Returns:
+        float: Mediana do tempo de execução, em milissegundos
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=PROJECT_DIR, capture_output=True, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def write_sample_playlist(path: str, track_count: int = 200) -> None:
+    """
+    Cria uma playlist de exemplo para o benchmark.
+
+    Args:
+        path (str): Caminho do ficheiro a criar
+        track_count (int, optional): Número de tracks da playlist
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("#EXTM3U\n")
+        for i in range(track_count):
+            f.write(f"#EXTINF:300,Artista {i} - A1) Track {i}\n")
+            f.write(f"/music/Vinyl Rips/Artista {i // 10} [K{i:03d}] (2000)/A1) Track {i}.flac\n")
+
+
+def main() -> None:
+    """
+    Corre o benchmark e imprime os resultados.
+    """
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--runs", type=int, default=10, help="Execuções por medição")
+    args = arg_parser.parse_args()
+
+    print("Tempo de importação (-X importtime, cumulativo):")
+    for module in ("cli", "gui"):
+        print(f"  {module:<5} {import_time_ms(module):8.1f} ms")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        playlist = os.path.join(temp_dir, "sample.m3u8")
+        output = os.path.join(temp_dir, "sample_lista.html")
+        write_sample_playlist(playlist)
+
+        print(f"\nArranque a frio (mediana de {args.runs} execuções):")
+        cli_ms = wall_time_ms(
+            [sys.executable, "cli.py", playlist, "-o", output], args.runs
+        )
+        gui_ms = wall_time_ms([sys.executable, "-c", "import gui"], args.runs)
+        print(f"  cli.py (conversão completa) {cli_ms:8.1f} ms")
+        print(f"  import gui (sem janela)     {gui_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,14 @@ echo.
 echo Compilando aplicacao para executavel...
 python -m PyInstaller --onefile --windowed --name="M3U8_Parser" main.py
 
+echo.
+echo Compilando modo headless (linha de comandos)...
+rem --onedir evita a descompactacao a cada arranque do --onefile
+python -m PyInstaller --onedir --console --exclude-module tkinter --name="M3U8_Parser_CLI" cli.py
+
 echo.
 echo Compilacao concluida!
 echo O executavel esta em: dist\M3U8_Parser.exe
+echo O executavel headless esta em: dist\M3U8_Parser_CLI\
 pause
 
@@ -6,7 +6,12 @@ echo ""
 echo "Compilando aplicação para executável..."
 python -m PyInstaller --onefile --windowed --name="M3U8_Parser" main.py
 
+echo ""
+echo "Compilando modo headless (linha de comandos)..."
+# --onedir evita a descompactação a cada arranque do --onefile
+python -m PyInstaller --onedir --console --exclude-module tkinter --name="M3U8_Parser_CLI" cli.py
+
 echo ""
 echo "Compilação concluída!"
 echo "O executável está em: dist/M3U8_Parser.exe"
-
+echo "O executável headless está em: dist/M3U8_Parser_CLI/"
@@ -0,0 +1,243 @@
+"""
+Modo sem interface gráfica (linha de comandos)
+
+Este módulo converte playlists .m3u8 em HTML (ou noutro formato, ver
+exporters.py) sem abrir a interface gráfica. Só carrega o parser, o
+gerador de HTML e os exportadores: o tkinter e os restantes módulos da
+interface nunca são importados, pelo que o arranque é muito mais rápido
+do que o da aplicação gráfica. Os módulos de junção e de
+comparação só são importados quando essas opções são usadas.
+
+Uso:
+    python cli.py playlist.m3u8                    # cria playlist_lista.html
+    python cli.py playlist.m3u8 -o lista.html --sort
+    python cli.py playlist.m3u8 -o lista.csv       # formato pela extensão
+    python cli.py playlist.m3u8 --format jsonl     # cria playlist_lista.jsonl
+    python cli.py sessao1.m3u8 sessao2.m3u8        # junta as playlists
+    python cli.py --diff antiga.m3u8 nova.m3u8     # só as alterações
+    exportar | python cli.py - | gzip > lista.html.gz  # stdin -> stdout
+
+Com "-" como playlist, a playlist é lida da entrada padrão e o HTML é
+escrito na saída padrão (ou em -o), à medida que as tracks chegam.
+
+O main.py também encaminha para este módulo quando recebe argumentos.
+
+Autor: Vinyl Playlist Parser
+Versão: 1.0
+"""
+
+import argparse
+import io
+import os
+import sys
+from typing import BinaryIO, List, Optional, TextIO
+
+from parser import iter_m3u8, parse_m3u8, playlist_basename
+from html_generator import generate_diff_html, save_html
+from exporters import EXPORTERS, export_tracks, format_for_path
+
+
+# Nome que representa a entrada padrão (playlist) ou a saída padrão (-o)
+STDIO_NAME = "-"
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """
+    Cria o parser de argumentos da linha de comandos.
+
+    Returns:
+        argparse.ArgumentParser: Parser com todas as opções do modo headless
+    """
+    arg_parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Converte playlists .m3u8 numa lista HTML pronta para impressão."
+    )
+    arg_parser.add_argument(
+        "playlists",
+        nargs="+",
+        help="Playlist(s) a processar (- para a entrada padrão). "
+             "Várias playlists são juntas sem duplicados."
+    )
+    arg_parser.add_argument(
+        "-o", "--output",
+        help="Ficheiro de saída (- para a saída padrão). Por padrão, "
+             "[nome]_lista.[formato] junto da playlist, ou a saída padrão com -"
+    )
+    arg_parser.add_argument(
+        "-f", "--format",
+        choices=sorted(EXPORTERS),
+        help="Formato de saída (por padrão, pela extensão de --output, ou html)"
+    )
+    arg_parser.add_argument(
+        "--title",
+        help="Título da lista (por padrão, o nome da playlist)"
+    )
+    arg_parser.add_argument(
+        "--sort",
+        action="store_true",
+        help="Ordenar por disco e lado/posição (A1, A2, B1...)"
+    )
+    arg_parser.add_argument(
+        "--diff",
+        action="store_true",
+        help="Comparar duas versões (ANTIGA NOVA) e gerar só as alterações"
+    )
+    arg_parser.add_argument(
+        "--no-nested",
+        action="store_true",
+        help="Não expandir referências a outras playlists"
+    )
+    return arg_parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ponto de entrada do modo headless.
+
+    Args:
+        argv (List[str], optional): Argumentos da linha de comandos (sem o
+            nome do programa). Por padrão usa sys.argv[1:].
+
+    Returns:
+        int: Código de saída (0 em caso de sucesso, 1 em caso de erro)
+    """
+    args = build_arg_parser().parse_args(argv)
+
+    if args.playlists.count(STDIO_NAME) > 1:
+        print("Erro: a entrada padrão (-) só pode ser lida uma vez", file=sys.stderr)
+        return 1
+
+    # A entrada padrão é lida como stream binário (sem ficheiro em disco)
+    sources = [
+        io.BufferedReader(_FlushingReader(sys.stdin.buffer)) if playlist == STDIO_NAME
+        else playlist
+        for playlist in args.playlists
+    ]
+
+    # A saída e o título baseiam-se na última playlist indicada
+    # (a versão nova, no caso de --diff)
+    source = args.playlists[-1]
+    from_stdin = source == STDIO_NAME
+    base_name = "Lista de Tracks" if from_stdin else playlist_basename(source)
+
+    # Com a entrada padrão, a saída padrão é usada por omissão
+    output = args.output or (STDIO_NAME if from_stdin else None)
+    to_stdout = output == STDIO_NAME
+
+    try:
+        if args.diff:
+            if len(args.playlists) != 2:
+                print("Erro: --diff precisa de exatamente duas playlists (ANTIGA NOVA)",
+                      file=sys.stderr)
+                return 1
+
+            from differ import diff_playlists
+
+            diff = diff_playlists(*sources, expand_nested=not args.no_nested)
+            html_content = generate_diff_html(diff, args.title or f"{base_name} - Alterações")
+
+            # Por padrão, guardar no mesmo diretório da playlist
+            output_path = output or os.path.join(
+                os.path.dirname(source), f"{base_name}_alteracoes.html"
+            )
+            if to_stdout:
+                _use_stdout().write(html_content)
+            else:
+                save_html(html_content, output_path)
+            summary = (
+                f"{len(diff['added'])} adicionadas, {len(diff['removed'])} removidas, "
+                f"{len(diff['moved'])} movidas"
+            )
+        else:
+            # Formato: --format, senão a extensão de --output, senão HTML
+            export_format = args.format
+            if export_format is None:
+                export_format = format_for_path(output) if output and not to_stdout else "html"
+
+            removed = None
+            if len(sources) > 1:
+                from merger import merge_playlists
+
+                tracks, removed = merge_playlists(
+                    sources, sort_tracks=args.sort, expand_nested=not args.no_nested
+                )
+            elif args.sort:
+                from sorting import natural_sort
+
+                tracks = natural_sort(parse_m3u8(sources[0], expand_nested=not args.no_nested))
+            else:
+                # Sem ordenação, as tracks são exportadas à medida que são lidas
+                tracks = iter_m3u8(sources[0], expand_nested=not args.no_nested)
+
+            # Por padrão, guardar no mesmo diretório da playlist
+            output_path = output or os.path.join(
+                os.path.dirname(source),
+                f"{base_name}_lista{EXPORTERS[export_format].extension}"
+            )
+            title = args.title or base_name
+            if to_stdout:
+                stdout = _use_stdout(EXPORTERS[export_format].newline)
+                count = export_tracks(tracks, stdout, export_format, title)
+                stdout.flush()
+            else:
+                count = export_tracks(tracks, output_path, export_format, title)
+            summary = f"{count} tracks"
+            if removed is not None:
+                summary += f", {len(removed)} duplicados removidos"
+
+    except BrokenPipeError:
+        # O comando seguinte do pipe terminou (ex.: head): sair sem erro
+        # visível, redirecionando o resto da saída para o dispositivo nulo
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except Exception as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+
+    # Com a saída padrão ocupada pelo conteúdo, o resumo vai para stderr
+    print(f"{output_path} ({summary})", file=sys.stderr if to_stdout else sys.stdout)
+    return 0
+
+
+class _FlushingReader(io.RawIOBase):
+    """
+    Entrada padrão que envia a saída pendente antes de cada leitura.
+
+    Em pipes, a saída só é escrita quando o buffer enche ou quando a
+    entrada precisa de mais dados (e pode ter de esperar por eles): as
+    tracks já convertidas chegam ao comando seguinte do pipe antes de a
+    playlist ter sido lida até ao fim, sem uma escrita por cada linha.
+
+    Args:
+        source (BinaryIO): Stream binário da entrada padrão (sys.stdin.buffer)
+    """
+
+    def __init__(self, source: BinaryIO):
+        super().__init__()
+        self.source = source
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        sys.stdout.flush()
+        # Uma única leitura: devolve os dados disponíveis sem esperar pelo resto
+        return self.source.readinto1(buffer)
+
+
+def _use_stdout(newline: Optional[str] = None) -> TextIO:
+    """
+    Prepara a saída padrão para receber o conteúdo exportado (UTF-8).
+
+    Args:
+        newline (str, optional): Valor de newline do formato (ver Exporter)
+
+    Returns:
+        TextIO: A saída padrão
+    """
+    sys.stdout.reconfigure(encoding="utf-8", newline=newline, line_buffering=False)
+    return sys.stdout
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+Comparação entre duas versões de uma playlist .m3u8
+
+Este módulo compara duas versões de uma playlist (por exemplo, antes e
+depois de uma nova exportação) e identifica as tracks adicionadas,
+removidas e movidas, para que seja possível imprimir apenas o que mudou.
+
+Algoritmo:
+    1. Cada track da versão antiga é indexada numa tabela de hash
+       (track -> posições), em tempo linear.
+    2. As tracks da versão nova são alinhadas com a versão antiga através
+       dessa tabela; as que não existem na antiga são adicionadas e as que
+       sobram na antiga são removidas.
+    3. Entre as tracks comuns, as que mantêm a ordem relativa formam a
+       maior subsequência crescente de posições antigas; as restantes são
+       consideradas movidas. Quando a ordem está intacta (o caso comum de
+       acrescentar ou inserir tracks), este passo é uma única verificação
+       linear.
+
+Exemplo:
+    >>> diff = diff_playlists("playlist_antiga.m3u8", "playlist_nova.m3u8")
+    >>> print(len(diff["added"]), len(diff["removed"]), len(diff["moved"]))
+
+Autor: Vinyl Playlist Parser
+Versão: 1.0
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+from parser import parse_m3u8
+
+
+def diff_tracks(
+    old_tracks: Sequence[Tuple[str, str]],
+    new_tracks: Sequence[Tuple[str, str]]
+) -> Dict[str, list]:
+    """
+    Compara duas listas de tracks e devolve as diferenças.
+
+    As posições devolvidas começam em 1, tal como aparecem na lista impressa.
+    Tracks repetidas são emparelhadas pela ordem em que aparecem.
+
+    Args:
+        old_tracks (Sequence[Tuple[str, str]]): Tracks da versão antiga
+        new_tracks (Sequence[Tuple[str, str]]): Tracks da versão nova
+
+    Returns:
+        Dict[str, list]: Dicionário com as chaves:
+            - "added": [(posição nova, folder, filename), ...]
+            - "removed": [(posição antiga, folder, filename), ...]
+            - "moved": [(posição antiga, posição nova, folder, filename), ...]
+
+    Exemplo:
+        >>> diff_tracks([("A", "1.flac")], [("A", "1.flac"), ("B", "2.flac")])
+        {'added': [(2, 'B', '2.flac')], 'removed': [], 'moved': []}
+    """
+    # Tabela de hash: track -> posições na versão antiga. A tabela é
+    # construída do fim para o início, para que pop() devolva a primeira
+    old_positions: Dict[Tuple[str, str], List[int]] = {}
+    for index in range(len(old_tracks) - 1, -1, -1):
+        positions = old_positions.get(old_tracks[index])
+        if positions is None:
+            old_positions[old_tracks[index]] = [index]
+        else:
+            positions.append(index)
+
+    added = []
+    matched = []  # Pares (índice antigo, índice novo) das tracks comuns
+
+    # Alinhar a versão nova com a antiga através da tabela de hash
+    for new_index, track in enumerate(new_tracks):
+        positions = old_positions.get(track)
+        if positions:
+            matched.append((positions.pop(), new_index))
+        else:
+            added.append((new_index + 1, track[0], track[1]))
+
+    # O que sobrou na tabela não existe na versão nova
+    removed = sorted(
+        (index + 1, track[0], track[1])
+        for track, positions in old_positions.items()
+        for index in positions
+    )
+
+    moved = [
+        (old_index + 1, new_index + 1, new_tracks[new_index][0], new_tracks[new_index][1])
+        for old_index, new_index in _out_of_order(matched)
+    ]
+
+    return {"added": added, "removed": removed, "moved": moved}
+
+
+def _out_of_order(matched: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Devolve os pares que não pertencem à maior subsequência ordenada.
+
+    Os pares estão pela ordem da versão nova; os que mantêm a ordem relativa
+    da versão antiga formam a maior subsequência crescente de índices
+    antigos (calculada em O(n log n)). Os restantes foram movidos.
+
+    Args:
+        matched (List[Tuple[int, int]]): Pares (índice antigo, índice novo)
+
+    Returns:
+        List[Tuple[int, int]]: Pares correspondentes a tracks movidas
+    """
+    old_indexes = [old_index for old_index, _ in matched]
+
+    # Caso comum (tracks acrescentadas ou inseridas): ordem intacta
+    if all(a < b for a, b in zip(old_indexes, old_indexes[1:])):
+        return []
+
+    # Maior subsequência crescente (patience sorting)
+    tails = []  # Menor índice antigo que termina uma subsequência de cada tamanho
+    tail_positions = []  # Posição em matched desse índice
+    previous = [-1] * len(old_indexes)  # Ligação para reconstruir a subsequência
+
+    for position, old_index in enumerate(old_indexes):
+        length = bisect_left(tails, old_index)
+        if length == len(tails):
+            tails.append(old_index)
+            tail_positions.append(position)
+        else:
+            tails[length] = old_index
+            tail_positions[length] = position
+        previous[position] = tail_positions[length - 1] if length else -1
+
+    # Marcar as posições que fazem parte da subsequência
+    in_order = [False] * len(old_indexes)
+    position = tail_positions[-1]
+    while position != -1:
+        in_order[position] = True
+        position = previous[position]
+
+    return [pair for pair, keep in zip(matched, in_order) if not keep]
+
+
+def diff_playlists(
+    old_path: str,
+    new_path: str,
+    expand_nested: bool = True
+) -> Dict[str, list]:
+    """
+    Lê duas versões de uma playlist .m3u8 e devolve as diferenças.
+
+    Args:
+        old_path (str): Caminho da versão antiga da playlist
+        new_path (str): Caminho da versão nova da playlist
+        expand_nested (bool, optional): Se True (padrão), expande as
+            referências a outras playlists (ver parser.parse_m3u8)
+
+    Returns:
+        Dict[str, list]: Diferenças no formato devolvido por diff_tracks()
+
+    Raises:
+        ValueError: Se algum ficheiro não puder ser lido
+        FileNotFoundError: Se algum ficheiro não existir
+    """
+    return diff_tracks(
+        parse_m3u8(old_path, expand_nested=expand_nested),
+        parse_m3u8(new_path, expand_nested=expand_nested)
+    )
@@ -0,0 +1,298 @@
+"""
+Exportação da lista de tracks para vários formatos
+
+Este módulo mantém um registo de exportadores (HTML, CSV, JSON Lines,
+Markdown e texto simples), para que a lista de tracks possa ser usada por
+outros scripts (inventário, etiquetas...) sem ter de extrair os dados do
+HTML.
+
+Streaming:
+    Todos os exportadores consomem as tracks uma a uma e escrevem
+    diretamente num ficheiro com buffer (ou num stream, ex.: sys.stdout).
+    Combinados com parser.iter_m3u8(), exportam playlists de qualquer
+    tamanho com memória constante.
+
+Exemplo:
+    >>> from parser import iter_m3u8
+    >>> export_tracks(iter_m3u8("playlist.m3u8"), "playlist.csv")
+    >>> export_tracks(tracks, "lista.txt", export_format="txt")
+
+Autor: Vinyl Playlist Parser
+Versão: 1.0
+"""
+
+import os
+import re
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+from html_generator import iter_html
+
+
+# Tamanho do buffer de escrita dos ficheiros exportados
+_BUFFER_SIZE = 1 << 16
+
+# Caracteres com significado especial em Markdown
+_MARKDOWN_SPECIAL_RE = re.compile(r'([\\`*_\[\]#|<>])')
+
+
+class Exporter(NamedTuple):
+    """
+    Descrição de um formato de exportação registado.
+
+    Atributos:
+        description (str): Nome do formato (usado nos diálogos de ficheiro)
+        extension (str): Extensão dos ficheiros deste formato (ex.: ".csv")
+        write (Callable): Função (tracks, f, title) -> número de tracks escritas
+        newline (Optional[str]): Valor de newline ao abrir o ficheiro
+    """
+    description: str
+    extension: str
+    write: Callable[[Iterable[Tuple[str, str]], TextIO, str], int]
+    newline: Optional[str] = None
+
+
+def write_html(tracks: Iterable[Tuple[str, str]], f: TextIO, title: str) -> int:
+    """
+    Escreve a lista de tracks como HTML print-ready (ver iter_html).
+
+    Cada track é escrita assim que é lida.
+
+    Args:
+        tracks (Iterable[Tuple[str, str]]): Tracks como (folder, filename)
+        f (TextIO): Ficheiro de destino, aberto em modo texto
+        title (str): Título da lista
+
+    Returns:
+        int: Número de tracks escritas
+    """
+    count = 0
+
+    def counted() -> Iterable[Tuple[str, str]]:
+        nonlocal count
+        for track in tracks:
+            count += 1
+            yield track
+
+    f.writelines(iter_html(counted(), title))
+    return count
+
+
+def write_csv(tracks: Iterable[Tuple[str, str]], f: TextIO, title: str) -> int:
+    """
+    Escreve a lista de tracks em CSV, com as colunas folder e filename.
+
+    Args:
+        tracks (Iterable[Tuple[str, str]]): Tracks como (folder, filename)
+        f (TextIO): Ficheiro de destino, aberto com newline=''
+        title (str): Título da lista (não usado em CSV)
+
+    Returns:
+        int: Número de tracks escritas
+    """
+    # Importado apenas quando é usado (arranque mais rápido do cli.py)
+    import csv
+
+    writer = csv.writer(f)
+    writer.writerow(("folder", "filename"))
+
+    count = 0
+    for track in tracks:
+        writer.writerow(track)
+        count += 1
+    return count
+
+
+def write_jsonl(tracks: Iterable[Tuple[str, str]], f: TextIO, title: str) -> int:
+    """
+    Escreve a lista de tracks em JSON Lines (um objeto JSON por linha).
+
+    Args:
+        tracks (Iterable[Tuple[str, str]]): Tracks como (folder, filename)
+        f (TextIO): Ficheiro de destino, aberto em modo texto
+        title (str): Título da lista (não usado em JSON Lines)
+
+    Returns:
+        int: Número de tracks escritas
+    """
+    # Importado apenas quando é usado (arranque mais rápido do cli.py)
+    import json
+
+    encoder = json.JSONEncoder(ensure_ascii=False)
+
+    count = 0
+    for folder, filename in tracks:
+        f.write(encoder.encode({"folder": folder, "filename": filename}))
+        f.write("\n")
+        count += 1
+    return count
+
+
+def write_markdown(tracks: Iterable[Tuple[str, str]], f: TextIO, title: str) -> int:
+    """
+    Escreve a lista de tracks em Markdown (título e lista com pasta em negrito).
+
+    Args:
+        tracks (Iterable[Tuple[str, str]]): Tracks como (folder, filename)
+        f (TextIO): Ficheiro de destino, aberto em modo texto
+        title (str): Título da lista
+
+    Returns:
+        int: Número de tracks escritas
+    """
+    f.write(f"# {_escape_markdown(title)}\n\n")
+
+    count = 0
+    for folder, filename in tracks:
+        f.write(f"- **{_escape_markdown(folder)}** - {_escape_markdown(filename)}\n")
+        count += 1
+    return count
+
+
+def write_text(tracks: Iterable[Tuple[str, str]], f: TextIO, title: str) -> int:
+    """
+    Escreve a lista de tracks em texto simples: [pasta] - [ficheiro].
+
+    Args:
+        tracks (Iterable[Tuple[str, str]]): Tracks como (folder, filename)
+        f (TextIO): Ficheiro de destino, aberto em modo texto
+        title (str): Título da lista (não usado em texto simples)
+
+    Returns:
+        int: Número de tracks escritas
+    """
+    count = 0
+    for folder, filename in tracks:
+        f.write(f"{folder} - {filename}\n")
+        count += 1
+    return count
+
+
+def _escape_markdown(text: str) -> str:
+    """
+    Escapa os caracteres com significado especial em Markdown.
+
+    Args:
+        text (str): Texto a escapar
+
+    Returns:
+        str: Texto com os caracteres especiais precedidos de "\\"
+    """
+    return _MARKDOWN_SPECIAL_RE.sub(r'\\\1', text)
+
+
+# Registo de exportadores: nome do formato -> Exporter
+EXPORTERS: Dict[str, Exporter] = {
+    "html": Exporter("Ficheiros HTML", ".html", write_html),
+    "csv": Exporter("Ficheiros CSV", ".csv", write_csv, newline=""),
+    "jsonl": Exporter("JSON Lines", ".jsonl", write_jsonl),
+    "md": Exporter("Markdown", ".md", write_markdown),
+    "txt": Exporter("Texto simples", ".txt", write_text),
+}
+
+
+def register_exporter(name: str, exporter: Exporter) -> None:
+    """
+    Regista (ou substitui) um formato de exportação.
+
+    Args:
+        name (str): Nome do formato (ex.: "csv")
+        exporter (Exporter): Descrição do formato
+    """
+    EXPORTERS[name] = exporter
+
+
+def format_for_path(output_path: str) -> str:
+    """
+    Determina o formato de exportação a partir da extensão do ficheiro.
+
+    Args:
+        output_path (str): Caminho do ficheiro de saída
+
+    Returns:
+        str: Nome do formato registado
+
+    Raises:
+        ValueError: Se a extensão não corresponder a nenhum formato registado
+    """
+    extension = os.path.splitext(output_path)[1].lower()
+    for name, exporter in EXPORTERS.items():
+        if exporter.extension == extension:
+            return name
+    raise ValueError(f"Formato de exportação desconhecido: {extension or output_path}")
+
+
+def export_filetypes() -> List[Tuple[str, str]]:
+    """
+    Devolve os tipos de ficheiro de todos os formatos, para diálogos tkinter.
+
+    Returns:
+        List[Tuple[str, str]]: Pares (descrição, padrão), ex.: ("Ficheiros CSV", "*.csv")
+    """
+    return [
+        (exporter.description, f"*{exporter.extension}")
+        for exporter in EXPORTERS.values()
+    ]
+
+
+def export_tracks(
+    tracks: Iterable[Tuple[str, str]],
+    output_path: Union[str, TextIO],
+    export_format: Optional[str] = None,
+    title: str = "Lista de Tracks"
+) -> int:
+    """
+    Exporta as tracks para um ficheiro, no formato indicado.
+
+    O ficheiro é escrito em UTF-8, através de um buffer, à medida que as
+    tracks são consumidas. A escrita é feita num ficheiro temporário
+    ([caminho].tmp), que só substitui o ficheiro de saída no fim: se a
+    leitura das tracks falhar a meio, um ficheiro já existente não é
+    alterado e não fica nenhum ficheiro incompleto. Em vez de um caminho,
+    pode ser indicado um stream de texto já aberto (ex.: sys.stdout), que
+    não é fechado.
+
+    Args:
+        tracks (Iterable[Tuple[str, str]]): Tracks como (folder, filename);
+            pode ser um gerador (ex.: parser.iter_m3u8)
+        output_path (str | TextIO): Caminho do ficheiro de saída, ou stream
+            de texto onde escrever
+        export_format (str, optional): Nome do formato (ver EXPORTERS).
+            Por padrão é determinado pela extensão de output_path
+            (obrigatório se output_path for um stream).
+        title (str, optional): Título da lista (HTML e Markdown)
+
+    Returns:
+        int: Número de tracks exportadas
+
+    Raises:
+        ValueError: Se o formato for desconhecido
+        PermissionError: Se não tiver permissão para escrever o ficheiro
+        Exception: Qualquer erro na leitura das tracks (ex.: FileNotFoundError)
+    """
+    if export_format is None:
+        export_format = format_for_path(output_path)
+
+    exporter = EXPORTERS.get(export_format)
+    if exporter is None:
+        raise ValueError(f"Formato de exportação desconhecido: {export_format}")
+
+    # Stream já aberto: escrever diretamente, sem o fechar
+    if hasattr(output_path, 'write'):
+        return exporter.write(tracks, output_path, title)
+
+    temp_path = f"{output_path}.tmp"
+    try:
+        with open(
+            temp_path, 'w', encoding='utf-8', newline=exporter.newline, buffering=_BUFFER_SIZE
+        ) as f:
+            count = exporter.write(tracks, f, title)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        # Erro (ou interrupção) a meio: apagar o ficheiro incompleto
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    return count
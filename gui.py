@@ -0,0 +1,889 @@
+"""
+Interface gráfica para parser de ficheiros .m3u8
+
+Este módulo implementa a interface gráfica usando tkinter para processar
+ficheiros .m3u8 e gerar listas HTML formatadas. É carregado pelo main.py
+apenas quando a aplicação é iniciada sem argumentos (modo gráfico).
+
+Autor: Vinyl Playlist Parser
+Versão: 1.0
+"""
+
+import tkinter as tk
+from tkinter import filedialog, messagebox, scrolledtext
+import os
+from parser import parse_m3u8, playlist_basename
+from html_generator import generate_html, generate_diff_html, save_html
+from differ import diff_playlists
+from exporters import export_filetypes, export_tracks, format_for_path
+from merger import merge_playlists, format_merge_report
+from recent import PlaylistWarmer, add_recent, load_recent
+from sorting import natural_sort
+from stats import LibraryStats, format_stats
+
+
+# Tipos de ficheiro aceites nos diálogos de abertura de playlists
+PLAYLIST_FILETYPES = [
+    ("Playlists", "*.m3u8 *.m3u *.m3u8.gz *.m3u8.xz *.m3u8.bz2 *.zip"),
+    ("Ficheiros M3U8", "*.m3u8"),
+    ("Ficheiros M3U", "*.m3u"),
+    ("Playlists comprimidas", "*.gz *.xz *.bz2 *.zip"),
+    ("Todos os ficheiros", "*.*")
+]
+
+
+def open_in_browser(file_path: str) -> None:
+    """
+    Abre um ficheiro no navegador padrão do sistema.
+    
+    O módulo webbrowser só é importado na primeira utilização, para não
+    atrasar o arranque da aplicação.
+    
+    Args:
+        file_path (str): Caminho do ficheiro a abrir
+    """
+    import webbrowser
+    
+    # Abrir ficheiro no navegador usando protocolo file://
+    webbrowser.open(f"file://{os.path.abspath(file_path)}")
+
+
+class M3U8ParserApp:
+    """
+    Classe principal da aplicação com interface gráfica.
+    
+    Gerencia toda a interface do utilizador, processamento de ficheiros
+    e geração de HTML através de uma interface gráfica intuitiva.
+    
+    As playlists recentes são pré-processadas em segundo plano quando a
+    janela fica inativa (ver recent.PlaylistWarmer); o pré-processamento
+    é interrompido assim que o utilizador inicia uma ação.
+    
+    Atributos:
+        root (tk.Tk): Janela principal da aplicação
+        m3u8_file_path (str): Caminho do ficheiro .m3u8 selecionado
+        tracks (List[Tuple[str, str]]): Lista de tracks processadas (folder, filename)
+        stats (LibraryStats): Estatísticas das tracks, acumuladas durante a leitura
+        html_file_path (str): Caminho do ficheiro HTML gerado
+        file_label (tk.Label): Label que mostra o ficheiro selecionado
+        parse_btn (tk.Button): Botão para processar o ficheiro
+        generate_btn (tk.Button): Botão para gerar HTML
+        open_btn (tk.Button): Botão para abrir HTML no navegador
+        one_click_btn (tk.Button): Botão para processo de 1 clique
+        sort_var (tk.BooleanVar): Opção de ordenar as tracks por disco e lado/posição
+        stats_var (tk.BooleanVar): Opção de incluir o resumo da coleção no HTML
+        recent_paths (List[str]): Playlists recentes (a mais recente primeiro)
+        recent_list (tk.Listbox): Lista das playlists recentes
+        warmer (PlaylistWarmer): Pré-processamento das playlists recentes
+        preview_text (scrolledtext.ScrolledText): Área de texto para preview/status
+        status_label (tk.Label): Barra de status na parte inferior
+    """
+    
+    def __init__(self, root):
+        """
+        Inicializa a aplicação e configura a interface gráfica.
+        
+        Args:
+            root (tk.Tk): Janela principal do tkinter
+        """
+        self.root = root
+        self.root.title("Parser M3U8 para HTML")
+        self.root.geometry("700x700")
+        # Define tamanho mínimo para permitir redimensionamento
+        self.root.minsize(600, 500)
+        
+        # Variáveis de estado da aplicação
+        self.m3u8_file_path = None  # Caminho do ficheiro .m3u8 selecionado
+        self.tracks = []  # Lista de tracks extraídas: [(folder, filename), ...]
+        self.stats = None  # Estatísticas das tracks (discos, formatos...)
+        self.html_file_path = None  # Caminho do ficheiro HTML gerado
+        self.recent_paths = load_recent()  # Playlists recentes (ficheiro JSON)
+        self.warmer = PlaylistWarmer()  # Tracks das recentes, lidas em segundo plano
+        
+        # Configurar interface gráfica
+        self.setup_ui()
+        
+        # Pré-processar as playlists recentes quando a janela estiver inativa
+        # (depois de desenhada), para não atrasar o arranque
+        self.root.after_idle(self.warmer.start, self.recent_paths)
+    
+    def setup_ui(self):
+        """
+        Configura todos os componentes da interface gráfica.
+        
+        Cria e organiza todos os widgets da aplicação:
+        - Título da aplicação
+        - Seletor de ficheiro
+        - Lista de playlists recentes
+        - Botão de processo de 1 clique
+        - Botões de ação individuais
+        - Área de preview/status
+        - Barra de status
+        """
+        # Frame principal que contém todos os elementos
+        main_frame = tk.Frame(self.root, padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Título da aplicação
+        title_label = tk.Label(
+            main_frame,
+            text="Parser M3U8 para Lista HTML",
+            font=("Arial", 16, "bold")
+        )
+        title_label.pack(pady=(0, 20))
+        
+        # Frame para seleção de ficheiro
+        file_frame = tk.Frame(main_frame)
+        file_frame.pack(fill=tk.X, pady=10)
+        
+        # Label que mostra o ficheiro selecionado
+        self.file_label = tk.Label(
+            file_frame,
+            text="Nenhum ficheiro selecionado",
+            font=("Arial", 10),
+            anchor="w",  # Alinhamento à esquerda
+            bg="#f0f0f0",  # Cor de fundo cinza claro
+            relief=tk.SUNKEN,  # Efeito de relevo afundado
+            padx=10,
+            pady=5
+        )
+        self.file_label.pack(fill=tk.X, side=tk.LEFT, expand=True)
+        
+        # Botão para selecionar ficheiro .m3u8
+        select_btn = tk.Button(
+            file_frame,
+            text="Selecionar .m3u8",
+            command=self.select_file,  # Callback quando clicado
+            bg="#4CAF50",  # Cor verde
+            fg="white",  # Texto branco
+            font=("Arial", 10, "bold"),
+            padx=15,
+            pady=5
+        )
+        select_btn.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Botão para juntar várias playlists numa só lista
+        merge_btn = tk.Button(
+            file_frame,
+            text="Juntar Playlists",
+            command=self.merge_files,
+            bg="#607D8B",  # Cor cinza azulado
+            fg="white",
+            font=("Arial", 10, "bold"),
+            padx=15,
+            pady=5
+        )
+        merge_btn.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Botão para comparar duas versões de uma playlist
+        compare_btn = tk.Button(
+            file_frame,
+            text="Comparar Versões",
+            command=self.compare_files,
+            bg="#795548",  # Cor castanha
+            fg="white",
+            font=("Arial", 10, "bold"),
+            padx=15,
+            pady=5
+        )
+        compare_btn.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Lista de playlists recentes (clique para selecionar)
+        recent_label = tk.Label(
+            main_frame,
+            text="Playlists recentes:",
+            font=("Arial", 9),
+            anchor="w"
+        )
+        recent_label.pack(fill=tk.X)
+        
+        self.recent_list = tk.Listbox(
+            main_frame,
+            height=4,  # Altura em linhas
+            font=("Arial", 9),
+            activestyle=tk.NONE,
+            relief=tk.SUNKEN,
+            # Selecionar texto noutro widget não deve limpar a seleção
+            # da lista (nem disparar <<ListboxSelect>>)
+            exportselection=False
+        )
+        self.recent_list.pack(fill=tk.X, pady=(0, 5))
+        self.recent_list.bind("<<ListboxSelect>>", self.select_recent)
+        self.refresh_recent_list()
+        
+        # Opção para ordenar as tracks por disco e lado/posição
+        self.sort_var = tk.BooleanVar(value=False)
+        sort_check = tk.Checkbutton(
+            main_frame,
+            text="Ordenar por disco e lado/posição (A1, A2, B1...)",
+            variable=self.sort_var,
+            font=("Arial", 9),
+            anchor="w"
+        )
+        sort_check.pack(fill=tk.X)
+        
+        # Opção para incluir o resumo da coleção (discos, formatos...) no HTML
+        self.stats_var = tk.BooleanVar(value=True)
+        stats_check = tk.Checkbutton(
+            main_frame,
+            text="Incluir resumo da coleção no HTML (discos, formatos, maiores/menores discos)",
+            variable=self.stats_var,
+            font=("Arial", 9),
+            anchor="w"
+        )
+        stats_check.pack(fill=tk.X)
+        
+        # Frame para o botão de 1-clique (destaque visual)
+        one_click_frame = tk.Frame(main_frame)
+        one_click_frame.pack(fill=tk.X, pady=15)
+        
+        # Botão principal: processo de 1 clique (processa, gera e abre)
+        self.one_click_btn = tk.Button(
+            one_click_frame,
+            text="⚡ Processar e Abrir HTML (1 Clique)",
+            command=self.one_click_process,
+            bg="#FF5722",  # Cor laranja/vermelho para destaque
+            fg="white",
+            font=("Arial", 12, "bold"),
+            padx=20,
+            pady=12,
+            state=tk.DISABLED,  # Desabilitado até selecionar ficheiro
+            cursor="hand2"  # Cursor de mão ao passar por cima
+        )
+        self.one_click_btn.pack(fill=tk.X)
+        
+        # Separador visual entre botão principal e botões secundários
+        separator = tk.Frame(main_frame, height=2, bg="#ccc")
+        separator.pack(fill=tk.X, pady=10)
+        
+        # Label informativo para botões manuais
+        manual_label = tk.Label(
+            main_frame,
+            text="Ou use os botões individuais:",
+            font=("Arial", 9),
+            fg="#666"  # Cor cinza
+        )
+        manual_label.pack(pady=(0, 5))
+        
+        # Frame para botões de ação individuais
+        action_frame = tk.Frame(main_frame)
+        action_frame.pack(fill=tk.X, pady=5)
+        
+        # Botão 1: Processar ficheiro (extrair tracks)
+        self.parse_btn = tk.Button(
+            action_frame,
+            text="Processar Ficheiro",
+            command=self.process_file,
+            bg="#2196F3",  # Cor azul
+            fg="white",
+            font=("Arial", 10, "bold"),
+            padx=15,
+            pady=8,
+            state=tk.DISABLED  # Desabilitado até selecionar ficheiro
+        )
+        self.parse_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Botão 2: Gerar HTML a partir das tracks processadas
+        self.generate_btn = tk.Button(
+            action_frame,
+            text="Gerar HTML",
+            command=self.generate_html,
+            bg="#FF9800",  # Cor laranja
+            fg="white",
+            font=("Arial", 10, "bold"),
+            padx=15,
+            pady=8,
+            state=tk.DISABLED  # Desabilitado até processar ficheiro
+        )
+        self.generate_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Botão 3: Abrir HTML gerado no navegador
+        self.open_btn = tk.Button(
+            action_frame,
+            text="Abrir HTML",
+            command=self.open_html,
+            bg="#9C27B0",  # Cor roxa
+            fg="white",
+            font=("Arial", 10, "bold"),
+            padx=15,
+            pady=8,
+            state=tk.DISABLED  # Desabilitado até gerar HTML
+        )
+        self.open_btn.pack(side=tk.LEFT)
+        
+        # Label para a área de preview
+        preview_label = tk.Label(
+            main_frame,
+            text="Preview / Status:",
+            font=("Arial", 10, "bold"),
+            anchor="w"
+        )
+        preview_label.pack(fill=tk.X, pady=(20, 5))
+        
+        # Área de texto com scroll para mostrar preview e status
+        self.preview_text = scrolledtext.ScrolledText(
+            main_frame,
+            height=15,  # Altura inicial em linhas
+            font=("Consolas", 9),  # Fonte monoespaçada para melhor leitura
+            wrap=tk.WORD,  # Quebra de linha por palavra
+            bg="#fafafa",  # Fundo branco suave
+            relief=tk.SUNKEN,
+            borderwidth=2
+        )
+        self.preview_text.pack(fill=tk.BOTH, expand=True)
+        
+        # Barra de status na parte inferior da janela
+        self.status_label = tk.Label(
+            main_frame,
+            text="Pronto",
+            font=("Arial", 9),
+            anchor="w",  # Alinhamento à esquerda
+            bg="#e0e0e0",  # Cor de fundo cinza
+            relief=tk.SUNKEN,
+            padx=10,
+            pady=3
+        )
+        self.status_label.pack(fill=tk.X, pady=(10, 0))
+    
+    def select_file(self):
+        """
+        Abre diálogo para selecionar ficheiro .m3u8.
+        
+        Permite ao utilizador escolher um ficheiro .m3u8 ou .m3u (também
+        comprimido com gzip, xz ou bzip2, ou dentro de um .zip) através
+        de um diálogo de seleção de ficheiro. Após seleção, atualiza a
+        interface e habilita os botões de processamento.
+        """
+        self.warmer.stop()
+        
+        # Abrir diálogo de seleção de ficheiro
+        file_path = filedialog.askopenfilename(
+            title="Selecionar ficheiro .m3u8",
+            filetypes=PLAYLIST_FILETYPES
+        )
+        
+        # Se um ficheiro foi selecionado
+        if file_path:
+            self.set_selected_file(file_path)
+    
+    def select_recent(self, event=None):
+        """
+        Seleciona a playlist escolhida na lista de recentes.
+        
+        Se a playlist já tiver sido pré-processada em segundo plano (e não
+        tiver sido modificada), as tracks são mostradas de imediato, sem
+        ler o ficheiro de novo.
+        
+        Args:
+            event (tk.Event, optional): Evento de seleção da lista
+        """
+        selection = self.recent_list.curselection()
+        if not selection:
+            return
+        
+        self.warmer.stop()
+        
+        file_path = self.recent_paths[selection[0]]
+        if not os.path.isfile(file_path):
+            messagebox.showwarning("Aviso", f"O ficheiro já não existe:\n{file_path}")
+            self.recent_paths = load_recent()
+            self.refresh_recent_list()
+            return
+        
+        self.set_selected_file(file_path)
+        
+        # Tracks já lidas em segundo plano: mostrar o resultado de imediato
+        result = self.warmer.get(file_path)
+        if result and result[0]:
+            tracks, self.stats = result
+            self.tracks = natural_sort(tracks) if self.sort_var.get() else tracks
+            self.show_tracks_preview()
+            self.generate_btn.config(state=tk.NORMAL)
+            self.update_status(f"Pronto a gerar: {len(self.tracks)} tracks (pré-processadas)")
+    
+    def set_selected_file(self, file_path: str):
+        """
+        Define a playlist selecionada e atualiza a interface.
+        
+        A playlist é também colocada no topo da lista de recentes.
+        
+        Args:
+            file_path (str): Caminho da playlist selecionada
+        """
+        self.m3u8_file_path = file_path
+        filename = os.path.basename(file_path)
+        
+        # Atualizar interface
+        self.file_label.config(text=f"Ficheiro: {filename}")
+        self.parse_btn.config(state=tk.NORMAL)  # Habilitar botão de processar
+        self.one_click_btn.config(state=tk.NORMAL)  # Habilitar botão de 1 clique
+        self.update_status(f"Ficheiro selecionado: {filename}")
+        
+        # Limpar e atualizar área de preview
+        self.preview_text.delete(1.0, tk.END)
+        self.preview_text.insert(tk.END, f"Ficheiro selecionado: {filename}\n")
+        self.preview_text.insert(tk.END, f"Caminho completo: {file_path}\n\n")
+        self.preview_text.insert(tk.END, "Clique em 'Processar e Abrir HTML (1 Clique)' para processar automaticamente,\n")
+        self.preview_text.insert(tk.END, "ou use os botões individuais abaixo.\n")
+        
+        # Atualizar a lista de recentes (guardada na pasta do utilizador)
+        self.recent_paths = add_recent(file_path)
+        self.refresh_recent_list()
+    
+    def refresh_recent_list(self):
+        """
+        Atualiza a lista de playlists recentes mostrada na interface.
+        """
+        self.recent_list.delete(0, tk.END)
+        for path in self.recent_paths:
+            self.recent_list.insert(tk.END, f"{os.path.basename(path)}  —  {os.path.dirname(path)}")
+    
+    def read_tracks(self, file_path: str):
+        """
+        Lê as tracks de uma playlist, usando as pré-processadas se existirem.
+        
+        As estatísticas são acumuladas na mesma leitura (sem percorrer a
+        lista de tracks de novo).
+        
+        Args:
+            file_path (str): Caminho da playlist
+            
+        Returns:
+            Tuple[List[Tuple[str, str]], LibraryStats]: Tracks (ordenadas, se
+                a opção estiver ativa) e as suas estatísticas
+        """
+        result = self.warmer.get(file_path)
+        if result is None:
+            stats = LibraryStats()
+            result = (parse_m3u8(file_path, stats=stats), stats)
+        
+        tracks, stats = result
+        if self.sort_var.get():
+            tracks = natural_sort(tracks)
+        return tracks, stats
+    
+    def merge_files(self):
+        """
+        Junta várias playlists selecionadas numa única lista de tracks.
+        
+        Permite selecionar vários ficheiros de uma vez, lê-os em paralelo,
+        remove as entradas duplicadas e mostra no preview o relatório do
+        que foi removido. As tracks resultantes ficam prontas para gerar HTML.
+        """
+        self.warmer.stop()
+        
+        # Abrir diálogo de seleção múltipla (a ordem da seleção é mantida)
+        file_paths = filedialog.askopenfilenames(
+            title="Selecionar playlists a juntar",
+            filetypes=PLAYLIST_FILETYPES
+        )
+        
+        # Se o utilizador cancelou, sair
+        if not file_paths:
+            return
+        
+        try:
+            self.update_status(f"A juntar {len(file_paths)} playlists...")
+            self.preview_text.delete(1.0, tk.END)
+            self.preview_text.insert(tk.END, f"A juntar {len(file_paths)} playlists...\n\n")
+            self.root.update()
+            
+            stats = LibraryStats()
+            tracks, removed = merge_playlists(
+                file_paths, sort_tracks=self.sort_var.get(), stats=stats
+            )
+            
+            if not tracks:
+                messagebox.showwarning("Aviso", "Nenhuma track foi encontrada nas playlists.")
+                self.update_status("Nenhuma track encontrada")
+                return
+            
+            # O resultado não corresponde a um único ficheiro .m3u8
+            self.tracks = tracks
+            self.stats = stats
+            self.m3u8_file_path = None
+            self.file_label.config(text=f"Playlists juntas: {len(file_paths)}")
+            self.parse_btn.config(state=tk.DISABLED)
+            self.one_click_btn.config(state=tk.DISABLED)
+            self.generate_btn.config(state=tk.NORMAL)
+            
+            # Mostrar resumo, relatório de duplicados e preview
+            self.preview_text.delete(1.0, tk.END)
+            for path in file_paths:
+                self.preview_text.insert(tk.END, f"• {os.path.basename(path)}\n")
+            self.preview_text.insert(tk.END, f"\nTracks após junção: {len(tracks)}\n")
+            self.preview_text.insert(tk.END, format_merge_report(removed) + "\n\n")
+            self.preview_text.insert(tk.END, format_stats(stats) + "\n\n")
+            self.preview_text.insert(tk.END, "Preview das primeiras 10 tracks:\n")
+            self.preview_text.insert(tk.END, "-" * 70 + "\n\n")
+            for folder, filename in tracks[:10]:
+                self.preview_text.insert(tk.END, f"{folder} - {filename}\n")
+            if len(tracks) > 10:
+                self.preview_text.insert(tk.END, f"\n... e mais {len(tracks) - 10} tracks\n")
+            
+            self.update_status(
+                f"Junção concluída: {len(tracks)} tracks, {len(removed)} duplicados removidos"
+            )
+            
+        except Exception as e:
+            error_msg = f"Erro ao juntar playlists:\n{str(e)}"
+            messagebox.showerror("Erro", error_msg)
+            self.update_status("Erro ao juntar playlists")
+            self.preview_text.insert(tk.END, f"\nERRO: {error_msg}\n")
+    
+    def compare_files(self):
+        """
+        Compara duas versões de uma playlist e abre o HTML só com as alterações.
+        
+        Pede a versão antiga e a versão nova da playlist, calcula as tracks
+        adicionadas, removidas e movidas, guarda o HTML de alterações no
+        diretório da versão nova ([nome]_alteracoes.html) e abre-o no navegador.
+        """
+        self.warmer.stop()
+        
+        # Pedir as duas versões (antiga primeiro)
+        old_path = filedialog.askopenfilename(
+            title="Selecionar versão ANTIGA da playlist",
+            filetypes=PLAYLIST_FILETYPES
+        )
+        if not old_path:
+            return
+        
+        new_path = filedialog.askopenfilename(
+            title="Selecionar versão NOVA da playlist",
+            filetypes=PLAYLIST_FILETYPES,
+            initialdir=os.path.dirname(old_path)
+        )
+        if not new_path:
+            return
+        
+        try:
+            self.update_status("A comparar versões...")
+            self.preview_text.delete(1.0, tk.END)
+            self.preview_text.insert(tk.END, "A comparar versões...\n\n")
+            self.root.update()
+            
+            diff = diff_playlists(old_path, new_path)
+            
+            # Guardar HTML de alterações junto da versão nova
+            new_basename = playlist_basename(new_path)
+            output_path = os.path.join(
+                os.path.dirname(new_path), f"{new_basename}_alteracoes.html"
+            )
+            html_content = generate_diff_html(diff, f"{new_basename} - Alterações")
+            save_html(html_content, output_path)
+            self.html_file_path = output_path
+            self.open_btn.config(state=tk.NORMAL)
+            
+            # Mostrar resumo das alterações
+            self.preview_text.delete(1.0, tk.END)
+            self.preview_text.insert(tk.END, f"Versão antiga: {os.path.basename(old_path)}\n")
+            self.preview_text.insert(tk.END, f"Versão nova: {os.path.basename(new_path)}\n\n")
+            self.preview_text.insert(tk.END, f"Adicionadas: {len(diff['added'])}\n")
+            self.preview_text.insert(tk.END, f"Removidas: {len(diff['removed'])}\n")
+            self.preview_text.insert(tk.END, f"Movidas: {len(diff['moved'])}\n\n")
+            self.preview_text.insert(tk.END, f"Ficheiro HTML: {output_path}\n")
+            
+            open_in_browser(output_path)
+            self.update_status(f"Alterações geradas: {os.path.basename(output_path)}")
+            
+        except Exception as e:
+            error_msg = f"Erro ao comparar versões:\n{str(e)}"
+            messagebox.showerror("Erro", error_msg)
+            self.update_status("Erro ao comparar versões")
+            self.preview_text.insert(tk.END, f"\nERRO: {error_msg}\n")
+    
+    def process_file(self):
+        """
+        Processa o ficheiro .m3u8 e extrai as tracks.
+        
+        Lê o ficheiro selecionado, extrai informações sobre cada track
+        e mostra um preview das primeiras 10 tracks na área de texto.
+        Habilita o botão de gerar HTML após processamento bem-sucedido.
+        
+        Raises:
+            Exception: Se houver erro ao processar o ficheiro
+        """
+        self.warmer.stop()
+        
+        # Verificar se há ficheiro selecionado
+        if not self.m3u8_file_path:
+            messagebox.showwarning("Aviso", "Por favor, selecione um ficheiro primeiro.")
+            return
+        
+        try:
+            # Atualizar status e interface
+            self.update_status("A processar ficheiro...")
+            self.preview_text.delete(1.0, tk.END)
+            self.preview_text.insert(tk.END, "A processar ficheiro...\n\n")
+            self.root.update()  # Atualizar interface para mostrar mudanças
+            
+            # Processar ficheiro usando o parser (ou as tracks pré-processadas)
+            self.tracks, self.stats = self.read_tracks(self.m3u8_file_path)
+            
+            # Verificar se foram encontradas tracks
+            if not self.tracks:
+                messagebox.showwarning("Aviso", "Nenhuma track foi encontrada no ficheiro.")
+                self.update_status("Nenhuma track encontrada")
+                return
+            
+            # Mostrar preview das tracks encontradas
+            self.show_tracks_preview()
+            
+            # Habilitar botão de gerar HTML
+            self.generate_btn.config(state=tk.NORMAL)
+            self.update_status(f"Processado com sucesso: {len(self.tracks)} tracks encontradas")
+            messagebox.showinfo("Sucesso", f"Ficheiro processado com sucesso!\n{len(self.tracks)} tracks encontradas.")
+            
+        except Exception as e:
+            # Tratar erros e mostrar mensagem
+            error_msg = f"Erro ao processar ficheiro:\n{str(e)}"
+            messagebox.showerror("Erro", error_msg)
+            self.update_status("Erro ao processar")
+            self.preview_text.insert(tk.END, f"\nERRO: {error_msg}\n")
+    
+    def show_tracks_preview(self):
+        """
+        Mostra na área de preview o número de tracks, o resumo da coleção
+        e as primeiras 10 tracks.
+        """
+        self.preview_text.delete(1.0, tk.END)
+        self.preview_text.insert(tk.END, f"Tracks encontradas: {len(self.tracks)}\n\n")
+        if self.stats is not None:
+            self.preview_text.insert(tk.END, format_stats(self.stats) + "\n\n")
+        self.preview_text.insert(tk.END, "Preview das primeiras 10 tracks:\n")
+        self.preview_text.insert(tk.END, "-" * 70 + "\n\n")
+        
+        # Mostrar primeiras 10 tracks
+        for folder, filename in self.tracks[:10]:
+            self.preview_text.insert(tk.END, f"{folder} - {filename}\n")
+        
+        # Se houver mais de 10 tracks, mostrar contador
+        if len(self.tracks) > 10:
+            self.preview_text.insert(tk.END, f"\n... e mais {len(self.tracks) - 10} tracks\n")
+    
+    def generate_html(self):
+        """
+        Gera o ficheiro HTML (ou outro formato) a partir das tracks processadas.
+        
+        Abre um diálogo para o utilizador escolher onde salvar a lista. O
+        formato (HTML, CSV, JSON Lines, Markdown ou texto) é determinado
+        pela extensão escolhida (ver exporters.EXPORTERS). Habilita o botão
+        de abrir HTML após geração bem-sucedida de um ficheiro HTML.
+        
+        Raises:
+            Exception: Se houver erro ao gerar ou salvar o HTML
+        """
+        self.warmer.stop()
+        
+        # Verificar se há tracks processadas
+        if not self.tracks:
+            messagebox.showwarning("Aviso", "Por favor, processe o ficheiro primeiro.")
+            return
+        
+        # Determinar nome padrão do ficheiro HTML
+        default_filename = "lista_tracks.html"
+        if self.m3u8_file_path:
+            # Usar nome do ficheiro .m3u8 como base
+            base_name = playlist_basename(self.m3u8_file_path)
+            default_filename = f"{base_name}_lista.html"
+        
+        # Abrir diálogo para salvar ficheiro (o formato é escolhido pela extensão)
+        output_path = filedialog.asksaveasfilename(
+            title="Salvar lista como",
+            defaultextension=".html",
+            filetypes=export_filetypes() + [("Todos os ficheiros", "*.*")],
+            initialfile=default_filename
+        )
+        
+        # Se o utilizador cancelou, sair
+        if not output_path:
+            return
+        
+        try:
+            export_format = format_for_path(output_path)
+            
+            # Atualizar status
+            self.update_status(f"A exportar ({export_format.upper()})...")
+            self.root.update()
+            
+            # Obter título do nome do ficheiro (sem extensão)
+            title = "Lista de Tracks"
+            if self.m3u8_file_path:
+                base_name = playlist_basename(self.m3u8_file_path)
+                title = base_name
+            
+            # Gerar e salvar o ficheiro no formato escolhido
+            # (o HTML pode incluir o resumo da coleção)
+            if export_format == "html":
+                save_html(generate_html(self.tracks, title, stats=self.html_stats()), output_path)
+            else:
+                export_tracks(self.tracks, output_path, export_format, title)
+            
+            # Só os ficheiros HTML podem ser abertos com o botão "Abrir HTML"
+            if export_format == "html":
+                self.html_file_path = output_path
+                self.open_btn.config(state=tk.NORMAL)  # Habilitar botão de abrir
+            
+            self.update_status(f"Ficheiro gerado com sucesso: {os.path.basename(output_path)}")
+            messagebox.showinfo("Sucesso", f"Ficheiro gerado com sucesso!\n\n{output_path}")
+            
+        except Exception as e:
+            # Tratar erros
+            error_msg = f"Erro ao gerar ficheiro:\n{str(e)}"
+            messagebox.showerror("Erro", error_msg)
+            self.update_status("Erro ao gerar ficheiro")
+    
+    def open_html(self):
+        """
+        Abre o ficheiro HTML gerado no navegador padrão do sistema.
+        
+        Verifica se o ficheiro existe e abre no navegador usando
+        o módulo webbrowser do Python (ver open_in_browser).
+        
+        Raises:
+            Exception: Se houver erro ao abrir o ficheiro
+        """
+        # Verificar se há ficheiro HTML gerado
+        if not self.html_file_path or not os.path.exists(self.html_file_path):
+            messagebox.showwarning("Aviso", "Nenhum ficheiro HTML foi gerado ainda.")
+            return
+        
+        try:
+            # Abrir ficheiro no navegador usando protocolo file://
+            open_in_browser(self.html_file_path)
+            self.update_status("HTML aberto no navegador")
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao abrir HTML:\n{str(e)}")
+    
+    def one_click_process(self):
+        """
+        Processo automatizado de 1 clique: processa, gera HTML e abre no navegador.
+        
+        Executa automaticamente os três passos principais:
+        1. Processa o ficheiro .m3u8 e extrai as tracks
+        2. Gera o HTML automaticamente (salva no mesmo diretório do .m3u8)
+        3. Abre o HTML no navegador
+        
+        Este método oferece uma experiência mais rápida para o utilizador,
+        eliminando a necessidade de múltiplos cliques e diálogos.
+        
+        Raises:
+            Exception: Se houver erro em qualquer etapa do processo
+        """
+        self.warmer.stop()
+        
+        # Verificar se há ficheiro selecionado
+        if not self.m3u8_file_path:
+            messagebox.showwarning("Aviso", "Por favor, selecione um ficheiro primeiro.")
+            return
+        
+        try:
+            # ========== PASSO 1: Processar ficheiro ==========
+            self.update_status("A processar ficheiro...")
+            self.preview_text.delete(1.0, tk.END)
+            self.preview_text.insert(tk.END, "Processo de 1 clique iniciado...\n\n")
+            self.preview_text.insert(tk.END, "1. A processar ficheiro...\n")
+            self.root.update()  # Atualizar interface
+            
+            # Processar ficheiro
+            self.tracks, self.stats = self.read_tracks(self.m3u8_file_path)
+            
+            # Verificar se foram encontradas tracks
+            if not self.tracks:
+                messagebox.showwarning("Aviso", "Nenhuma track foi encontrada no ficheiro.")
+                self.update_status("Nenhuma track encontrada")
+                return
+            
+            self.preview_text.insert(tk.END, f"   ✓ {len(self.tracks)} tracks encontradas\n\n")
+            self.root.update()
+            
+            # ========== PASSO 2: Gerar HTML automaticamente ==========
+            self.update_status("A gerar HTML...")
+            self.preview_text.insert(tk.END, "2. A gerar HTML...\n")
+            self.root.update()
+            
+            # Determinar caminho de saída (mesmo diretório do .m3u8)
+            m3u8_dir = os.path.dirname(self.m3u8_file_path)
+            m3u8_basename = playlist_basename(self.m3u8_file_path)
+            output_path = os.path.join(m3u8_dir, f"{m3u8_basename}_lista.html")
+            
+            # Obter título do nome do ficheiro (sem extensão)
+            title = m3u8_basename
+            
+            # Gerar HTML
+            html_content = generate_html(self.tracks, title, stats=self.html_stats())
+            
+            # Salvar ficheiro
+            save_html(html_content, output_path)
+            self.html_file_path = output_path
+            
+            self.preview_text.insert(tk.END, f"   ✓ HTML gerado: {os.path.basename(output_path)}\n\n")
+            self.root.update()
+            
+            # ========== PASSO 3: Abrir no navegador ==========
+            self.update_status("A abrir no navegador...")
+            self.preview_text.insert(tk.END, "3. A abrir no navegador...\n")
+            self.root.update()
+            
+            # Abrir HTML no navegador
+            open_in_browser(output_path)
+            
+            # Mostrar conclusão
+            self.preview_text.insert(tk.END, f"   ✓ Aberto no navegador\n\n")
+            self.preview_text.insert(tk.END, "✓ Processo concluído com sucesso!\n")
+            self.preview_text.insert(tk.END, f"\nFicheiro HTML: {output_path}\n")
+            self.preview_text.insert(tk.END, "O ficheiro está pronto para impressão.\n")
+            
+            # Habilitar botões para uso futuro
+            self.generate_btn.config(state=tk.NORMAL)
+            self.open_btn.config(state=tk.NORMAL)
+            self.update_status(f"Concluído: {len(self.tracks)} tracks processadas e HTML aberto")
+            
+        except Exception as e:
+            # Tratar erros
+            error_msg = f"Erro no processo:\n{str(e)}"
+            messagebox.showerror("Erro", error_msg)
+            self.update_status("Erro no processo")
+            self.preview_text.insert(tk.END, f"\n✗ ERRO: {error_msg}\n")
+    
+    def html_stats(self):
+        """
+        Devolve as estatísticas a incluir no HTML, conforme a opção escolhida.
+        
+        Returns:
+            Optional[LibraryStats]: Estatísticas, ou None se o resumo não
+                deve ser incluído
+        """
+        return self.stats if self.stats_var.get() else None
+    
+    def update_status(self, message: str):
+        """
+        Atualiza a mensagem na barra de status.
+        
+        Args:
+            message (str): Nova mensagem a exibir na barra de status
+        """
+        self.status_label.config(text=message)
+
+
+def main():
+    """
+    Inicia a aplicação em modo gráfico.
+    
+    Cria a janela principal do tkinter, instancia a aplicação
+    e inicia o loop de eventos da interface gráfica.
+    """
+    # Criar janela principal
+    root = tk.Tk()
+    
+    # Criar instância da aplicação
+    app = M3U8ParserApp(root)
+    
+    # Iniciar loop de eventos (bloqueia até fechar a janela)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    # Executar apenas se o ficheiro for executado diretamente
+    main()
@@ -6,15 +6,31 @@ criando documentos otimizados para visualização e impressão. O HTML gerado
 inclui formatação especial onde o nome da pasta aparece em negrito e o
 nome do ficheiro aparece destacado em amarelo com fonte diferente.
 
+O HTML pode também ser gerado em partes (iter_html), à medida que as
+tracks são lidas, para ser escrito num ficheiro ou num pipe sem construir
+o documento completo em memória.
+
+Opcionalmente, o documento começa com um resumo da coleção (discos,
+tracks por disco, formatos e maiores/menores discos), a partir das
+estatísticas acumuladas durante a leitura (ver stats.py).
+
 Autor: Vinyl Playlist Parser
 Versão: 1.0
 """
 
 from datetime import datetime
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sorting import natural_sort
+from stats import LibraryStats
 
 
-def generate_html(tracks: List[Tuple[str, str]], title: str = "Lista de Tracks") -> str:
+def generate_html(
+    tracks: List[Tuple[str, str]],
+    title: str = "Lista de Tracks",
+    sort_tracks: bool = False,
+    stats: Optional[LibraryStats] = None
+) -> str:
     """
     Gera HTML formatado e print-ready a partir de uma lista de tracks.
     
@@ -28,6 +44,12 @@ def generate_html(tracks: List[Tuple[str, str]], title: str = "Lista de Tracks")
             - filename (str): Nome do ficheiro
         title (str, optional): Título da página HTML. 
             Por padrão usa "Lista de Tracks".
+        sort_tracks (bool, optional): Se True, ordena as tracks por disco e
+            lado/posição (A1, A2, B1...) antes de gerar o HTML.
+            Por padrão mantém a ordem da playlist.
+        stats (LibraryStats, optional): Estatísticas das tracks, acumuladas
+            durante a leitura (ex.: parse_m3u8(..., stats=stats)). Se
+            indicadas, o documento começa com um bloco de resumo.
         
     Returns:
         str: String contendo o HTML completo pronto para ser salvo
@@ -40,31 +62,214 @@ def generate_html(tracks: List[Tuple[str, str]], title: str = "Lista de Tracks")
         >>> html = generate_html(tracks, "Minha Playlist")
         >>> # html contém o HTML completo como string
     """
+    return "".join(iter_html(tracks, title, sort_tracks, stats))
+
+
+def iter_html(
+    tracks: Iterable[Tuple[str, str]],
+    title: str = "Lista de Tracks",
+    sort_tracks: bool = False,
+    stats: Optional[LibraryStats] = None
+) -> Iterator[str]:
+    """
+    Gera o HTML de generate_html() em partes, à medida que as tracks chegam.
+    
+    O cabeçalho do documento é gerado antes de ler a primeira track e cada
+    track é gerada assim que é lida, pelo que as primeiras tracks podem ser
+    escritas (ex.: num pipe) antes de a playlist ter sido lida até ao fim.
+    Juntas, as partes são iguais ao resultado de generate_html().
+    
+    Args:
+        tracks (Iterable[Tuple[str, str]]): Tracks como (folder, filename);
+            pode ser um gerador (ex.: parser.iter_m3u8)
+        title (str, optional): Título da página HTML
+        sort_tracks (bool, optional): Se True, ordena as tracks por disco e
+            lado/posição (neste caso, todas as tracks são lidas primeiro)
+        stats (LibraryStats, optional): Estatísticas já completas das
+            tracks (o bloco de resumo é gerado antes da primeira track)
+        
+    Yields:
+        str: Partes consecutivas do documento HTML
+        
+    Exemplo:
+        >>> with open("lista.html", "w", encoding="utf-8") as f:
+        ...     f.writelines(iter_html(iter_m3u8("playlist.m3u8"), "Minha Playlist"))
+    """
     # Gerar data e hora atual para exibir no documento
     now = datetime.now()
     date_str = now.strftime("%d/%m/%Y %H:%M")  # Formato: DD/MM/YYYY HH:MM
     
-    # Construir lista de items HTML
-    # Cada track será um div com spans separados para folder e filename
-    items_html = []
+    # Ordenar por disco e lado/posição, se pedido
+    if sort_tracks:
+        tracks = natural_sort(tracks)
+    
+    head, tail = _page_parts(title, date_str)
+    yield head
+    if stats is not None:
+        yield _stats_html(stats)
+    yield '    <div class="tracks-list">\n'
+    
+    # Cada track é um div com spans separados para folder e filename;
+    # os items são separados por quebras de linha
+    separator = ""
     for folder, filename in tracks:
-        # Criar HTML para cada track:
         # - folder-name: span com nome da pasta (será formatado em negrito)
         # - file-name: span com nome do ficheiro (será destacado em amarelo)
-        item_html = (
-            f'        <div class="track-item">'
+        yield (
+            f'{separator}        <div class="track-item">'
             f'<span class="folder-name">{folder}</span> - '
             f'<span class="file-name">{filename}</span>'
             f'</div>'
         )
-        items_html.append(item_html)
+        separator = "\n"
+    
+    yield '\n    </div>'
+    yield tail
+
+
+def generate_diff_html(diff: Dict[str, list], title: str = "Alterações") -> str:
+    """
+    Gera HTML print-ready apenas com as alterações entre duas playlists.
+    
+    Cria um documento com o mesmo estilo de generate_html(), dividido em
+    secções de tracks adicionadas, removidas e movidas. Secções vazias
+    são omitidas.
+    
+    Args:
+        diff (Dict[str, list]): Diferenças devolvidas por
+            differ.diff_tracks() ou differ.diff_playlists()
+        title (str, optional): Título da página HTML.
+            Por padrão usa "Alterações".
+        
+    Returns:
+        str: String contendo o HTML completo pronto para ser salvo
+        
+    Exemplo:
+        >>> diff = diff_playlists("antiga.m3u8", "nova.m3u8")
+        >>> html = generate_diff_html(diff, "Alterações da Playlist")
+    """
+    date_str = datetime.now().strftime("%d/%m/%Y %H:%M")
+    
+    # Cada secção: (título, classe CSS, items HTML)
+    sections = [
+        ("Adicionadas", "added", [
+            _track_item_html(folder, filename, f"+ {position}.")
+            for position, folder, filename in diff["added"]
+        ]),
+        ("Removidas", "removed", [
+            _track_item_html(folder, filename, f"&minus; {position}.")
+            for position, folder, filename in diff["removed"]
+        ]),
+        ("Movidas", "moved", [
+            _track_item_html(folder, filename, f"{old_position} &rarr; {new_position}.")
+            for old_position, new_position, folder, filename in diff["moved"]
+        ]),
+    ]
+    
+    parts = []
+    for section_title, css_class, items in sections:
+        if not items:
+            continue
+        parts.append(
+            f'    <h2 class="change-title {css_class}">{section_title} ({len(items)})</h2>\n'
+            f'    <div class="tracks-list">\n'
+            + "\n".join(items)
+            + '\n    </div>'
+        )
+    
+    # Sem alterações: mostrar apenas uma nota
+    if not parts:
+        parts.append('    <p class="no-changes">Sem alterações.</p>')
+    
+    return _render_page(title, date_str, "\n\n".join(parts))
+
+
+def _stats_html(stats: LibraryStats) -> str:
+    """
+    Cria o bloco de resumo da coleção (colocado antes da lista de tracks).
+    
+    Args:
+        stats (LibraryStats): Estatísticas acumuladas
+        
+    Returns:
+        str: HTML do bloco de resumo
+    """
+    formats = " &middot; ".join(
+        f"{extension} {count} ({count * 100 / stats.track_count:.0f}%)"
+        for extension, count in stats.formats.most_common()
+    )
+    largest = " &middot; ".join(
+        f"{folder} ({count})" for folder, count in stats.largest_records()
+    )
+    smallest = " &middot; ".join(
+        f"{folder} ({count})" for folder, count in stats.smallest_records()
+    )
+    
+    return (
+        f'    <div class="stats">\n'
+        f'        <div class="stats-summary"><strong>{stats.record_count}</strong> discos'
+        f' &middot; <strong>{stats.track_count}</strong> tracks'
+        f' &middot; <strong>{stats.average_tracks:.1f}</strong> tracks por disco</div>\n'
+        f'        <div class="stats-row"><span class="stats-label">Formatos:</span> {formats}</div>\n'
+        f'        <div class="stats-row"><span class="stats-label">Maiores discos:</span> {largest}</div>\n'
+        f'        <div class="stats-row"><span class="stats-label">Menores discos:</span> {smallest}</div>\n'
+        f'    </div>\n'
+        f'    \n'
+    )
+
+
+def _track_item_html(folder: str, filename: str, marker: str) -> str:
+    """
+    Cria o HTML de uma track numa lista de alterações.
     
-    # Juntar todos os items em uma única string com quebras de linha
-    items_content = "\n".join(items_html)
+    Args:
+        folder (str): Nome do último diretório
+        filename (str): Nome do ficheiro
+        marker (str): Indicação da alteração (ex.: "+ 12.")
+        
+    Returns:
+        str: HTML do item da track
+    """
+    return (
+        f'        <div class="track-item">'
+        f'<span class="change-marker">{marker}</span> '
+        f'<span class="folder-name">{folder}</span> - '
+        f'<span class="file-name">{filename}</span>'
+        f'</div>'
+    )
+
+
+def _render_page(title: str, date_str: str, body: str) -> str:
+    """
+    Envolve o conteúdo no documento HTML completo com o CSS de impressão.
+    
+    Args:
+        title (str): Título da página HTML
+        date_str (str): Data de geração já formatada
+        body (str): HTML do conteúdo a colocar após o cabeçalho
+        
+    Returns:
+        str: String contendo o HTML completo
+    """
+    head, tail = _page_parts(title, date_str)
+    return head + body + tail
+
+
+def _page_parts(title: str, date_str: str) -> Tuple[str, str]:
+    """
+    Devolve o início e o fim do documento HTML, à volta do conteúdo.
     
+    Args:
+        title (str): Título da página HTML
+        date_str (str): Data de geração já formatada
+        
+    Returns:
+        Tuple[str, str]: (head, tail) - o HTML antes do conteúdo (documento,
+            CSS e cabeçalho) e o HTML depois do conteúdo
+    """
     # HTML completo com CSS inline para print-friendly
     # O CSS está inline para garantir que o ficheiro seja autocontido
-    html = f"""<!DOCTYPE html>
+    head = f"""<!DOCTYPE html>
 <html lang="pt-PT">
 <head>
     <meta charset="UTF-8">
@@ -142,6 +347,56 @@ def generate_html(tracks: List[Tuple[str, str]], title: str = "Lista de Tracks")
             padding: 2px 4px;  /* Espaçamento interno para melhor legibilidade */
         }}
         
+        /* Títulos das secções de alterações */
+        h2.change-title {{
+            font-size: 14pt;
+            margin-top: 25px;
+            padding-left: 8px;
+            border-left: 6px solid #000;
+        }}
+        
+        h2.added {{
+            border-left-color: #2e7d32;  /* Verde */
+        }}
+        
+        h2.removed {{
+            border-left-color: #c62828;  /* Vermelho */
+        }}
+        
+        h2.moved {{
+            border-left-color: #1565c0;  /* Azul */
+        }}
+        
+        /* Indicação da alteração (+, −, posição antiga → nova) */
+        .change-marker {{
+            font-family: 'Courier New', Courier, monospace;
+            color: #555;
+        }}
+        
+        /* Resumo da coleção (discos, formatos...) */
+        .stats {{
+            margin-bottom: 20px;
+            padding: 10px 12px;
+            border: 1px solid #000;
+            font-size: 10pt;
+            page-break-inside: avoid;
+        }}
+        
+        .stats-summary {{
+            font-size: 12pt;
+            margin-bottom: 4px;
+        }}
+        
+        .stats-label {{
+            font-weight: bold;
+        }}
+        
+        /* Nota quando não há alterações */
+        .no-changes {{
+            margin-top: 20px;
+            font-style: italic;
+        }}
+        
         /* Estilos específicos para impressão */
         @media print {{
             /* Ajustes de layout para impressão */
@@ -183,13 +438,12 @@ def generate_html(tracks: List[Tuple[str, str]], title: str = "Lista de Tracks")
         <div class="date">Gerado em: {date_str}</div>
     </div>
     
-    <div class="tracks-list">
-{items_content}
-    </div>
+"""
+    tail = """
 </body>
 </html>"""
     
-    return html
+    return head, tail
 
 
 def save_html(html_content: str, output_path: str) -> None:
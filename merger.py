@@ -0,0 +1,149 @@
+"""
+Junção de várias playlists .m3u8 numa única lista
+
+Este módulo combina várias playlists (por exemplo, de várias sessões) numa
+única lista de tracks pronta para impressão. As playlists são lidas em
+paralelo, juntas pela ordem indicada (ou ordenadas) e as entradas
+duplicadas são removidas.
+
+Deduplicação:
+    Duas entradas são consideradas iguais quando o par (folder, filename)
+    normalizado coincide. A normalização ignora maiúsculas/minúsculas e
+    trata como equivalentes os separadores (espaços, "_", "/" e "\\").
+    As chaves normalizadas são guardadas num set, pelo que a junção é
+    linear no número total de entradas.
+
+Exemplo:
+    >>> tracks, removed = merge_playlists(["sessao1.m3u8", "sessao2.m3u8"])
+    >>> print(format_merge_report(removed))
+
+Autor: Vinyl Playlist Parser
+Versão: 1.0
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from parser import parse_m3u8
+from sorting import natural_sort
+from stats import LibraryStats
+
+
+# Sequências de separadores consideradas equivalentes na normalização
+_SEPARATORS_RE = re.compile(r'[\s_/\\]+')
+
+
+def normalize_key(text: str) -> str:
+    """
+    Normaliza um nome de pasta ou ficheiro para comparação.
+
+    Converte para minúsculas (casefold) e substitui qualquer sequência de
+    separadores (espaços, "_", "/" e "\\") por um único espaço.
+
+    Args:
+        text (str): Nome da pasta ou do ficheiro
+
+    Returns:
+        str: Versão normalizada do texto
+
+    Exemplo:
+        >>> normalize_key("A1) Groove Jet_pn.flac")
+        'a1) groove jet pn.flac'
+    """
+    return _SEPARATORS_RE.sub(' ', text).strip().casefold()
+
+
+def merge_playlists(
+    file_paths: Sequence[str],
+    sort_tracks: bool = False,
+    max_workers: Optional[int] = None,
+    stats: Optional[LibraryStats] = None,
+    expand_nested: bool = True
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str, str]]]:
+    """
+    Lê várias playlists em paralelo e junta-as numa única lista sem duplicados.
+
+    As playlists são processadas concorrentemente, mas o resultado respeita
+    sempre a ordem de ``file_paths``. Quando uma track aparece mais do que
+    uma vez, é mantida a primeira ocorrência e as restantes são registadas
+    no relatório de removidas.
+
+    Args:
+        file_paths (Sequence[str]): Caminhos das playlists a juntar (por ordem)
+        sort_tracks (bool, optional): Se True, ordena o resultado final por
+            disco e lado/posição (ver sorting.natural_sort). Por padrão
+            mantém a ordem original.
+        max_workers (int, optional): Número máximo de leituras em paralelo.
+            Por padrão usa o valor do ThreadPoolExecutor.
+        stats (LibraryStats, optional): Estatísticas a atualizar com cada
+            track mantida (os duplicados não são contados)
+        expand_nested (bool, optional): Se True (padrão), expande as
+            referências a outras playlists (ver parser.parse_m3u8)
+
+    Returns:
+        Tuple: Tupla contendo:
+            - tracks (List[Tuple[str, str]]): Lista final de (folder, filename)
+            - removed (List[Tuple[str, str, str]]): Entradas removidas como
+              (ficheiro de origem, folder, filename)
+
+    Raises:
+        ValueError: Se alguma playlist não puder ser lida
+        FileNotFoundError: Se alguma playlist não existir
+    """
+    # Ler todas as playlists em paralelo; map() preserva a ordem de entrada
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        parsed = list(executor.map(
+            partial(parse_m3u8, expand_nested=expand_nested), file_paths
+        ))
+
+    tracks = []  # Tracks mantidas: [(folder, filename), ...]
+    removed = []  # Duplicados: [(origem, folder, filename), ...]
+    seen = set()  # Chaves normalizadas já vistas
+
+    # Cache das pastas normalizadas (as tracks de um álbum partilham a pasta)
+    folder_keys: Dict[str, str] = {}
+
+    for source, playlist_tracks in zip(file_paths, parsed):
+        for folder, filename in playlist_tracks:
+            folder_key = folder_keys.get(folder)
+            if folder_key is None:
+                folder_key = folder_keys[folder] = normalize_key(folder)
+
+            key = (folder_key, normalize_key(filename))
+            if key in seen:
+                removed.append((source, folder, filename))
+                continue
+
+            seen.add(key)
+            tracks.append((folder, filename))
+            if stats is not None:
+                stats.add(folder, filename)
+
+    if sort_tracks:
+        tracks = natural_sort(tracks)
+
+    return tracks, removed
+
+
+def format_merge_report(removed: List[Tuple[str, str, str]]) -> str:
+    """
+    Formata o relatório de entradas removidas durante a junção.
+
+    Args:
+        removed (List[Tuple[str, str, str]]): Entradas removidas, tal como
+            devolvidas por merge_playlists()
+
+    Returns:
+        str: Texto do relatório, uma linha por entrada removida
+    """
+    if not removed:
+        return "Nenhum duplicado removido."
+
+    lines = [f"Duplicados removidos: {len(removed)}"]
+    for source, folder, filename in removed:
+        lines.append(f"  [{os.path.basename(source)}] {folder} - {filename}")
+
+    return "\n".join(lines)
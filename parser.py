@@ -15,15 +15,86 @@ Exemplo:
     #EXTINF:376,Spiller Feat. Sophie Ellis-Bextor - A1) Groove Jet pn
     O:\My Music\My Vinyl Rips\Spiller - _Mighty Miami E.P. [K089] (2000)\A1) Groove Jet_pn.flac
 
+Ficheiros comprimidos:
+    Playlists comprimidas com gzip (.gz), xz (.xz) ou bzip2 (.bz2), ou
+    guardadas num arquivo .zip, são lidas diretamente. O formato é detetado
+    pelos primeiros bytes do ficheiro e o conteúdo é descomprimido em
+    streaming, sem ficheiros temporários.
+
+Leitura em bytes:
+    Ficheiros não comprimidos são mapeados em memória e processados em
+    bytes; só a pasta e o nome de cada track são descodificados (ver
+    _scan_file). O resultado é o mesmo do processamento em texto.
+
+Objetos de ficheiro:
+    parse_m3u8() e iter_m3u8() aceitam também streams já abertos (ex.:
+    sys.stdin.buffer ou io.BytesIO), em modo binário ou texto. O conteúdo é
+    processado à medida que chega, sem ficheiros temporários.
+
+Playlists aninhadas:
+    Uma linha de caminho que termine em .m3u8 ou .m3u é tratada como
+    referência a outra playlist e é expandida recursivamente (ver parse_m3u8).
+
 Autor: Vinyl Playlist Parser
 Versão: 1.0
 """
 
+import codecs
+import io
+import mmap
 import os
-from typing import List, Tuple
+import re
+import stat
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from stats import LibraryStats
+
+
+# Extensões de ficheiros tratados como playlists (incluindo comprimidas)
+PLAYLIST_EXTENSIONS = (
+    '.m3u8', '.m3u',
+    '.m3u8.gz', '.m3u.gz',
+    '.m3u8.xz', '.m3u.xz',
+    '.m3u8.bz2', '.m3u.bz2',
+)
+
+# Lista de encodings a tentar (por ordem de preferência)
+# UTF-8 é o mais comum, mas alguns ficheiros podem usar Windows-1252 ou Latin-1
+ENCODINGS = ['utf-8', 'utf-8-sig', 'windows-1252', 'latin-1']
+
+# Tamanho dos blocos lidos ao detetar o encoding em streaming
+_CHUNK_SIZE = 1 << 16
+
+# Em Windows, os caminhos aceitam "\\" como separador (além de "/")
+_WINDOWS_PATHS = os.name == 'nt'
+
+# Marcador #EXTINF: seguido da próxima linha não vazia (capturada)
+_TRACK_RE = re.compile(rb'#EXTINF:[^\n]*(?:\n[ \t\x0b\x0c\r]*)*\n([^\n]*)')
+
+# "\r" que não faz parte de "\r\n" (quebra de linha antiga do Mac OS)
+_LONE_CR_RE = re.compile(rb'\r(?!\n)')
 
+# Possíveis referências a sub-playlists (deteção rápida em bytes)
+_PLAYLIST_REFERENCE_RE = re.compile(rb'(?i)\.m3u')
 
-def parse_m3u8(file_path: str) -> List[Tuple[str, str]]:
+# Bytes que não existem em Windows-1252 (o ficheiro só pode ser Latin-1)
+_CP1252_UNDEFINED = [b'\x81', b'\x8d', b'\x8f', b'\x90', b'\x9d']
+
+# Assinaturas (primeiros bytes) dos formatos comprimidos suportados
+_MAGIC_BYTES = [
+    (b'\x1f\x8b', 'gzip'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'BZh', 'bzip2'),
+    (b'PK\x03\x04', 'zip'),
+]
+
+
+def parse_m3u8(
+    file_path: Union[str, BinaryIO, TextIO],
+    expand_nested: bool = True,
+    max_workers: Optional[int] = None,
+    stats: Optional[LibraryStats] = None
+) -> List[Tuple[str, str]]:
     """
     Lê um ficheiro .m3u8 e extrai o último diretório e nome do ficheiro de cada track.
     
@@ -31,8 +102,25 @@ def parse_m3u8(file_path: str) -> List[Tuple[str, str]]:
     entradas de tracks (linhas #EXTINF: seguidas de caminhos de ficheiro) e
     extrai o último diretório e o nome do ficheiro de cada track.
     
+    Playlists aninhadas:
+        Linhas que referenciam outras playlists (.m3u8 ou .m3u) são expandidas
+        recursivamente, no lugar onde aparecem. Caminhos relativos são
+        resolvidos a partir do diretório da playlist que os contém. Cada
+        sub-playlist é lida uma única vez (tabela de memoização), mesmo que
+        seja referenciada por várias playlists, e as sub-playlists de cada
+        nível são lidas em paralelo.
+    
     Args:
-        file_path (str): Caminho completo para o ficheiro .m3u8 a processar
+        file_path (str | BinaryIO | TextIO): Caminho completo para o ficheiro
+            .m3u8 a processar, ou um objeto de ficheiro já aberto (ver
+            iter_m3u8)
+        expand_nested (bool, optional): Se True (padrão), expande as
+            referências a outras playlists. Se False, as referências são
+            tratadas como tracks normais.
+        max_workers (int, optional): Número máximo de sub-playlists lidas
+            em paralelo. Por padrão usa o valor do ThreadPoolExecutor.
+        stats (LibraryStats, optional): Estatísticas a atualizar com cada
+            track, à medida que a lista final é construída (ver stats.py)
         
     Returns:
         List[Tuple[str, str]]: Lista de tuplas onde cada tupla contém:
@@ -40,70 +128,1060 @@ def parse_m3u8(file_path: str) -> List[Tuple[str, str]]:
             - filename (str): Nome do ficheiro (com extensão)
             
     Raises:
-        ValueError: Se o ficheiro não puder ser lido com nenhum encoding suportado
-        FileNotFoundError: Se o ficheiro não existir
+        ValueError: Se o ficheiro não puder ser lido com nenhum encoding
+            suportado, ou se as playlists aninhadas formarem um ciclo
+        FileNotFoundError: Se o ficheiro (ou uma sub-playlist) não existir
         
     Exemplo:
         >>> tracks = parse_m3u8("playlist.m3u8")
         >>> print(tracks[0])
         ('Spiller - _Mighty Miami E.P. [K089] (2000)', 'A1) Groove Jet_pn.flac')
     """
-    tracks = []  # Lista para armazenar as tracks extraídas
+    # Objetos de ficheiro só podem ser lidos uma vez, em streaming
+    if hasattr(file_path, 'read'):
+        return list(iter_m3u8(
+            file_path, expand_nested=expand_nested, stats=stats, max_workers=max_workers
+        ))
+    
+    if not expand_nested and stats is None:
+        return _read_entries(file_path, expand_nested=False)
+    
+    # Ler a playlist e todas as sub-playlists
+    root_key, memo = _read_playlist_tree(file_path, expand_nested, max_workers)
+    
+    # Expandir as referências pela ordem em que aparecem
+    tracks = _flatten(root_key, memo, [root_key])
+    if stats is not None:
+        tracks = stats.collect(tracks)
+    return list(tracks)
+
+
+def iter_m3u8(
+    file_path: Union[str, BinaryIO, TextIO],
+    expand_nested: bool = True,
+    stats: Optional[LibraryStats] = None,
+    max_workers: Optional[int] = None
+) -> Iterator[Tuple[str, str]]:
+    """
+    Gera as tracks de um ficheiro .m3u8 uma a uma, sem construir a lista.
+    
+    Produz as mesmas tracks que parse_m3u8(), mas à medida que o ficheiro
+    é lido, pelo que a memória usada não depende do tamanho da playlist.
+    O encoding é determinado primeiro com uma leitura em streaming do
+    ficheiro; as tracks são depois geradas numa segunda leitura.
+    
+    Se a playlist referenciar sub-playlists, é lida como em parse_m3u8():
+    cada sub-playlist é lida uma única vez e as de cada nível em paralelo,
+    antes de gerar a primeira track; as tracks são depois geradas pela
+    ordem da playlist, sem construir a lista final.
+    
+    Em vez de um caminho, pode ser indicado um objeto de ficheiro já aberto
+    (ex.: sys.stdin.buffer), que é lido uma única vez, linha a linha: cada
+    track é gerada assim que a sua linha chega. Um stream binário pode
+    estar comprimido com gzip, xz ou bzip2 e é descodificado linha a linha
+    (ver _decode_lines; fora de UTF-8, o encoding pode ser escolhido de
+    forma diferente da leitura do ficheiro). Caminhos relativos são
+    resolvidos a partir do diretório atual. Como o stream não pode ser
+    lido antecipadamente, cada sub-playlist que ele referencia é lida
+    quando a referência chega (com as suas próprias sub-playlists, nível a
+    nível); as sub-playlists partilhadas continuam a ser lidas uma única
+    vez.
+    
+    Args:
+        file_path (str | BinaryIO | TextIO): Caminho completo para o ficheiro
+            .m3u8 a processar, ou um objeto de ficheiro (binário ou texto)
+        expand_nested (bool, optional): Se True (padrão), expande as
+            referências a outras playlists
+        stats (LibraryStats, optional): Estatísticas a atualizar com cada
+            track gerada (ver stats.py)
+        max_workers (int, optional): Número máximo de sub-playlists lidas
+            em paralelo (ver parse_m3u8)
+        
+    Yields:
+        Tuple[str, str]: Tuplas (folder, filename), pela ordem da playlist
+        
+    Raises:
+        ValueError: Se o ficheiro não puder ser lido com nenhum encoding
+            suportado, ou se as playlists aninhadas formarem um ciclo
+        FileNotFoundError: Se o ficheiro (ou uma sub-playlist) não existir
+        
+    Exemplo:
+        >>> for folder, filename in iter_m3u8("playlist.m3u8"):
+        ...     print(f"{folder} - {filename}")
+        >>> tracks = iter_m3u8(sys.stdin.buffer)
+    """
+    tracks = _iter_tracks(file_path, expand_nested, max_workers)
+    return tracks if stats is None else stats.collect(tracks)
+
+
+def _iter_tracks(
+    file_path: Union[str, BinaryIO, TextIO],
+    expand_nested: bool,
+    max_workers: Optional[int]
+) -> Iterator:
+    """
+    Abre uma playlist e devolve o gerador das suas tracks (ver iter_m3u8).
+    
+    A playlist é aberta (e a compressão, o encoding e as sub-playlists
+    determinados) já nesta chamada e não na primeira track: um ficheiro
+    inexistente ou ilegível falha antes de o resultado começar a ser
+    consumido (ex.: antes de criar o ficheiro exportado).
+    
+    Args:
+        file_path (str | BinaryIO | TextIO): Caminho ou objeto de ficheiro
+        expand_nested (bool): Se True, expande as referências a outras playlists
+        max_workers (Optional[int]): Número máximo de sub-playlists lidas em paralelo
+        
+    Returns:
+        Iterator: Tuplas (folder, filename), pela ordem da playlist
+    """
+    # Objetos de ficheiro: processar as linhas à medida que chegam
+    if hasattr(file_path, 'read'):
+        return _expand_references(
+            _iter_stream_entries(file_path, expand_nested), max_workers=max_workers
+        )
+    
+    base_dir = os.path.dirname(os.path.abspath(file_path))
+    
+    # Pipes, FIFOs e dispositivos (ex.: /dev/stdin, <(...)) só podem ser
+    # lidos uma vez: processar como stream, numa única abertura
+    if not _is_regular_file(file_path):
+        stream = open(file_path, 'rb')
+        try:
+            entries = _iter_stream_entries(stream, expand_nested, base_dir)
+        except BaseException:
+            stream.close()
+            raise
+        return _iter_closing(stream, _expand_references(entries, file_path, max_workers))
+    
+    compression = detect_compression(file_path)
+    
+    # Arquivos .zip podem conter várias playlists: usar a leitura completa
+    if compression == 'zip':
+        return iter(parse_m3u8(file_path, expand_nested=expand_nested, max_workers=max_workers))
+    
+    # Ficheiros não comprimidos: processar diretamente em bytes, se possível
+    # (None se o ficheiro puder referenciar sub-playlists)
+    if compression is None:
+        entries = _scan_file(file_path, base_dir, expand_nested)
+        if entries is not None:
+            return entries
+    
+    def open_stream() -> BinaryIO:
+        return _open_binary(file_path, compression)
+    
+    encoding, has_references = _detect_encoding(open_stream, file_path, expand_nested)
+    
+    # Com sub-playlists: ler a árvore completa (uma vez cada, em paralelo)
+    if has_references:
+        root_key, memo = _read_playlist_tree(file_path, expand_nested, max_workers)
+        return _flatten(root_key, memo, [root_key])
+    
+    f = io.TextIOWrapper(open_stream(), encoding=encoding)
+    return _iter_closing(f, _iter_entries(f, base_dir, expand_nested))
+
+
+def _iter_closing(stream: io.IOBase, items: Iterator) -> Iterator:
+    """
+    Gera os elementos de um iterador e fecha o stream de onde são lidos.
+    
+    Args:
+        stream (io.IOBase): Stream a fechar no fim (ou se a geração parar)
+        items (Iterator): Elementos lidos do stream
+        
+    Yields:
+        Os elementos de items
+    """
+    with stream:
+        yield from items
+
+
+def _read_playlist_tree(
+    file_path: str,
+    expand_nested: bool,
+    max_workers: Optional[int]
+) -> Tuple[str, Dict[str, list]]:
+    """
+    Lê uma playlist e todas as sub-playlists que ela referencia.
+    
+    Args:
+        file_path (str): Caminho da playlist
+        expand_nested (bool): Se True, lê também as sub-playlists
+        max_workers (Optional[int]): Número máximo de sub-playlists lidas em paralelo
+        
+    Returns:
+        Tuple[str, Dict[str, list]]: Caminho normalizado da playlist e
+            tabela de memoização (playlist normalizada -> entradas lidas)
+    """
+    root_key = _playlist_key(file_path)
+    memo: Dict[str, list] = {root_key: _read_entries(file_path, expand_nested)}
+    _read_references(_new_references(memo[root_key], memo), memo, max_workers)
+    return root_key, memo
+
+
+def _read_references(
+    pending: List[str],
+    memo: Dict[str, list],
+    max_workers: Optional[int]
+) -> None:
+    """
+    Lê as sub-playlists indicadas e as que elas referenciam, para memo.
+    
+    As sub-playlists são lidas nível a nível; as de cada nível em paralelo.
+    As que já estão em memo não são lidas de novo.
+    
+    Args:
+        pending (List[str]): Sub-playlists a ler (caminhos normalizados)
+        memo (Dict[str, list]): Tabela de memoização, atualizada no lugar
+        max_workers (Optional[int]): Número máximo de sub-playlists lidas em paralelo
+    """
+    if not pending:
+        return
+    
+    # Importado apenas quando há sub-playlists (arranque mais rápido)
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            level = list(zip(pending, executor.map(_read_entries, pending)))
+            memo.update(level)
+            
+            # Próximo nível: referências das playlists acabadas de ler
+            # (dict.fromkeys remove repetidos mantendo a ordem)
+            pending = list(dict.fromkeys(
+                key
+                for _, entries in level
+                for key in _new_references(entries, memo)
+            ))
+
+
+def _expand_references(
+    entries: Iterable,
+    file_path: Optional[str] = None,
+    max_workers: Optional[int] = None
+) -> Iterator:
+    """
+    Gera as tracks de uma sequência de entradas, expandindo as referências.
+    
+    Usado com streams, que não podem ser lidos antecipadamente: cada
+    sub-playlist é lida quando a sua referência chega, juntamente com as
+    suas próprias sub-playlists (ver _read_references). A tabela de
+    memoização é partilhada por todas as referências, pelo que cada
+    sub-playlist é lida uma única vez.
+    
+    Args:
+        entries (Iterable): Entradas no formato devolvido por _read_entries()
+        file_path (str, optional): Caminho da playlist que contém as
+            entradas (para detetar referências a si própria)
+        max_workers (int, optional): Número máximo de sub-playlists lidas
+            em paralelo
+        
+    Yields:
+        Tuple[str, str]: Tuplas (folder, filename)
+        
+    Raises:
+        ValueError: Se as playlists aninhadas formarem um ciclo
+    """
+    # Tabela de memoização: playlist normalizada -> entradas lidas. A
+    # playlist que contém as entradas fica marcada como lida (não pode
+    # ser relida) e referências a ela são detetadas como ciclo
+    memo: Dict[str, list] = {}
+    stack: List[str] = []
+    if file_path is not None:
+        root_key = _playlist_key(file_path)
+        memo[root_key] = []
+        stack.append(root_key)
     
-    # Lista de encodings a tentar (por ordem de preferência)
-    # UTF-8 é o mais comum, mas alguns ficheiros podem usar Windows-1252 ou Latin-1
-    encodings = ['utf-8', 'utf-8-sig', 'windows-1252', 'latin-1']
-    content = None
+    for entry in entries:
+        if not isinstance(entry, str):
+            yield entry
+            continue
+        
+        if entry in stack:
+            cycle = " -> ".join(os.path.basename(path) for path in stack + [entry])
+            raise ValueError(f"Referência circular entre playlists: {cycle}")
+        
+        # Referência: ler a sub-playlist (e as suas), exceto as já lidas
+        _read_references(_new_references([entry], memo), memo, max_workers)
+        
+        stack.append(entry)
+        yield from _flatten(entry, memo, stack)
+        stack.pop()
+
+
+def _iter_stream_entries(
+    stream: Union[BinaryIO, TextIO],
+    expand_nested: bool,
+    base_dir: Optional[str] = None
+) -> Iterator:
+    """
+    Extrai as entradas de um objeto de ficheiro, à medida que é lido.
+    
+    Args:
+        stream (BinaryIO | TextIO): Stream binário (eventualmente comprimido)
+            ou de texto
+        expand_nested (bool): Se True, gera referências a sub-playlists
+        base_dir (str, optional): Diretório usado para resolver referências
+            relativas. Por padrão, o diretório atual.
+        
+    Returns:
+        Iterator: Entradas no formato devolvido por _read_entries()
+        
+    Raises:
+        ValueError: Se o stream for um arquivo .zip
+    """
+    if isinstance(stream.read(0), str):
+        # Stream de texto (ex.: sys.stdin): já descodificado
+        lines = stream
+    else:
+        compression = _stream_compression(stream)
+        if compression == 'zip':
+            raise ValueError(
+                "Arquivos .zip não podem ser lidos em streaming; indique o caminho do ficheiro"
+            )
+        lines = _decode_lines(_open_binary(stream, compression))
+    
+    # Sem ficheiro, os caminhos relativos partem do diretório atual
+    if base_dir is None:
+        base_dir = os.getcwd()
+    return _iter_entries(lines, base_dir, expand_nested)
+
+
+def _decode_lines(stream: BinaryIO) -> Iterator[str]:
+    """
+    Descodifica um stream binário linha a linha, com quebras de linha universais.
+    
+    O stream não pode ser relido, pelo que o encoding não é determinado
+    antes da leitura: cada linha é descodificada com o primeiro encoding de
+    ENCODINGS que ainda não falhou. A partir da primeira linha que não é
+    UTF-8 válido passa a usar-se Windows-1252 (ou Latin-1). Como "\\n"
+    nunca faz parte de um carácter multibyte nestes encodings, as linhas
+    podem ser descodificadas separadamente.
+    
+    As linhas já geradas não são descodificadas de novo, pelo que o
+    resultado pode diferir da leitura de um ficheiro (que usa um único
+    encoding para todo o conteúdo) quando o encoding muda: numa playlist
+    em Windows-1252, uma linha anterior que por acaso seja UTF-8 válido
+    (ex.: "Ã©") é lida como UTF-8 ("é"); numa playlist em Latin-1, os
+    bytes 0x80-0x9F anteriores ao primeiro byte que não existe em
+    Windows-1252 são lidos como Windows-1252. Playlists em UTF-8 dão
+    sempre o mesmo resultado.
+    
+    Args:
+        stream (BinaryIO): Stream binário (já descomprimido)
+        
+    Yields:
+        str: Linhas descodificadas (com "\\r\\n" e "\\r" convertidos em "\\n")
+    """
+    encodings = iter(ENCODINGS)
+    encoding = next(encodings)
+    
+    # Iterar sobre o stream devolve cada linha assim que está completa
+    for raw_line in stream:
+        while True:
+            try:
+                line = raw_line.decode(encoding)
+                break
+            except UnicodeDecodeError:
+                # Latin-1 descodifica qualquer byte: a lista nunca se esgota
+                encoding = next(encodings)
+        
+        # "\r" isolado (Mac OS antigo) também termina uma linha
+        if '\r' in line:
+            yield from line.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        else:
+            yield line
+
+
+def _read_entries(file_path: str, expand_nested: bool = True) -> list:
+    """
+    Lê uma playlist sem expandir as sub-playlists.
+    
+    O ficheiro pode estar em texto simples ou comprimido (gzip, xz, bzip2
+    ou zip); o formato é detetado pelos primeiros bytes (ver
+    detect_compression). Num .zip, todas as playlists contidas são lidas
+    pela ordem do arquivo. Caminhos que não são ficheiros regulares (pipes,
+    ex.: /dev/stdin) são lidos uma única vez, como um stream (ver
+    iter_m3u8); nesse caso um .zip não é suportado.
+    
+    Args:
+        file_path (str): Caminho da playlist
+        expand_nested (bool, optional): Se True, as linhas que referenciam
+            outras playlists são devolvidas como referências
+        
+    Returns:
+        list: Entradas pela ordem do ficheiro. Cada entrada é uma track
+            (tupla (folder, filename)) ou uma referência a uma sub-playlist
+            (str com o caminho normalizado, ver _playlist_key)
+    
+    Raises:
+        ValueError: Se o ficheiro não puder ser lido com nenhum encoding
+            suportado, se um .zip não contiver nenhuma playlist, ou se um
+            pipe contiver um .zip
+        FileNotFoundError: Se o ficheiro não existir
+    """
+    base_dir = os.path.dirname(os.path.abspath(file_path))
+    
+    # Pipes, FIFOs e dispositivos só podem ser lidos uma vez: a deteção da
+    # compressão e do encoding consumiria o conteúdo. Processar como stream
+    if not _is_regular_file(file_path):
+        with open(file_path, 'rb') as stream:
+            return list(_iter_stream_entries(stream, expand_nested, base_dir))
+    
+    compression = detect_compression(file_path)
+    
+    # Ficheiros não comprimidos: processar diretamente em bytes, se possível
+    if compression is None:
+        entries = _scan_file(file_path, base_dir, expand_nested)
+        if entries is not None:
+            return list(entries)
+    
+    if compression != 'zip':
+        return _decode_entries(
+            lambda: _open_binary(file_path, compression), file_path, base_dir, expand_nested
+        )
+    
+    # Arquivo .zip: ler cada playlist contida diretamente do arquivo
+    import zipfile
     
+    with zipfile.ZipFile(file_path) as archive:
+        members = [
+            name for name in archive.namelist()
+            if name.lower().endswith(PLAYLIST_EXTENSIONS)
+        ]
+        if not members:
+            raise ValueError(f"O arquivo {file_path} não contém nenhuma playlist")
+        
+        entries = []
+        for name in members:
+            entries.extend(_decode_entries(
+                lambda: archive.open(name), f"{file_path}:{name}", base_dir, expand_nested
+            ))
+        return entries
+
+
+def _decode_entries(
+    open_stream: Callable[[], BinaryIO],
+    name: str,
+    base_dir: str,
+    expand_nested: bool
+) -> list:
+    """
+    Descodifica e processa um stream binário, tentando vários encodings.
+    
+    O conteúdo é descodificado e processado em blocos, à medida que é lido
+    (e descomprimido), sem ficheiros temporários e sem guardar o texto
+    completo em memória. Se um encoding falhar, o stream é reaberto e
+    processado de novo com o encoding seguinte.
+    
+    Args:
+        open_stream (Callable[[], BinaryIO]): Função que abre o stream
+            binário desde o início
+        name (str): Nome do ficheiro (para mensagens de erro)
+        base_dir (str): Diretório usado para resolver referências relativas
+        expand_nested (bool): Se True, devolve referências a sub-playlists
+        
+    Returns:
+        list: Entradas no formato devolvido por _read_entries()
+        
+    Raises:
+        ValueError: Se o conteúdo não puder ser lido com nenhum encoding suportado
+    """
     # Tentar ler o ficheiro com diferentes encodings
-    for encoding in encodings:
+    for encoding in ENCODINGS:
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.readlines()  # Ler todas as linhas do ficheiro
-            break  # Se leitura bem-sucedida, sair do loop
+            with io.TextIOWrapper(open_stream(), encoding=encoding) as f:
+                return list(_iter_entries(f, base_dir, expand_nested))
         except (UnicodeDecodeError, UnicodeError):
             # Se falhar, tentar próximo encoding
             continue
     
-    # Verificar se conseguiu ler o ficheiro
-    if content is None:
-        raise ValueError(
-            f"Não foi possível ler o ficheiro {file_path} com nenhum encoding suportado"
-        )
+    # Nenhum encoding conseguiu ler o ficheiro
+    raise ValueError(
+        f"Não foi possível ler o ficheiro {name} com nenhum encoding suportado"
+    )
+
+
+def _detect_encoding(
+    open_stream: Callable[[], BinaryIO],
+    name: str,
+    find_references: bool = False
+) -> Tuple[str, bool]:
+    """
+    Determina o encoding de um stream binário sem guardar o texto em memória.
+    
+    Cada encoding de ENCODINGS é testado descodificando o stream em blocos;
+    é devolvido o primeiro que descodifica o conteúdo completo, tal como em
+    _decode_entries(). Na mesma leitura, os blocos podem ser procurados por
+    possíveis referências a sub-playlists (como em _scan_file).
+    
+    Args:
+        open_stream (Callable[[], BinaryIO]): Função que abre o stream
+            binário desde o início
+        name (str): Nome do ficheiro (para mensagens de erro)
+        find_references (bool, optional): Se True, procura referências
+        
+    Returns:
+        Tuple[str, bool]: Encoding a usar, e True se o conteúdo puder
+            referenciar sub-playlists (sempre False sem find_references)
+        
+    Raises:
+        ValueError: Se o conteúdo não puder ser lido com nenhum encoding suportado
+    """
+    has_references = False
+    
+    for encoding in ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open_stream() as stream:
+                tail = b''  # Fim do bloco anterior (".m3u" entre dois blocos)
+                for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b''):
+                    if find_references and not has_references:
+                        has_references = bool(_PLAYLIST_REFERENCE_RE.search(tail + chunk))
+                        tail = chunk[-3:]
+                    decoder.decode(chunk)
+                decoder.decode(b'', final=True)
+            return encoding, has_references
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+    
+    raise ValueError(
+        f"Não foi possível ler o ficheiro {name} com nenhum encoding suportado"
+    )
+
+
+def _iter_entries(lines: Iterable[str], base_dir: str, expand_nested: bool) -> Iterator:
+    """
+    Extrai as tracks e referências a sub-playlists de uma sequência de linhas.
+    
+    As entradas são geradas à medida que as linhas são lidas.
+    
+    Args:
+        lines (Iterable[str]): Linhas da playlist (já descodificadas)
+        base_dir (str): Diretório usado para resolver referências relativas
+        expand_nested (bool): Se True, gera referências a sub-playlists
+        
+    Yields:
+        Entradas no formato devolvido por _read_entries()
+    """
+    after_extinf = False  # True se a linha anterior (não vazia) era #EXTINF:
     
     # Processar o conteúdo linha a linha
-    i = 0
-    while i < len(content):
-        line = content[i].strip()  # Remover espaços em branco no início/fim
+    for raw_line in lines:
+        line = raw_line.strip()  # Remover espaços em branco no início/fim
+        
+        # Ignorar linhas vazias (incluindo entre #EXTINF: e o caminho do ficheiro)
+        if not line:
+            continue
+        
+        if after_extinf:
+            # A linha não vazia a seguir a #EXTINF: é sempre consumida;
+            # só é um caminho válido se não começar com # (comentários ou metadados)
+            after_extinf = False
+            if line.startswith('#'):
+                continue
+            
+            if expand_nested and _is_playlist_path(line):
+                yield _resolve_reference(line, base_dir)
+                continue
+            
+            # Extrair último diretório e nome do ficheiro
+            folder, filename = extract_folder_and_filename(line)
+            
+            # Adicionar à lista apenas se ambos os valores forem válidos
+            if folder and filename:
+                yield (folder, filename)
         
         # Procurar linhas que começam com #EXTINF:
         # Estas linhas indicam o início de uma entrada de track
-        if line.startswith('#EXTINF:'):
-            # A próxima linha não vazia deve conter o caminho do ficheiro
-            i += 1
+        elif line.startswith('#EXTINF:'):
+            after_extinf = True
+        
+        # Referências a outras playlists não precisam de #EXTINF:
+        elif expand_nested and not line.startswith('#') and _is_playlist_path(line):
+            yield _resolve_reference(line, base_dir)
+
+
+def _scan_file(file_path: str, base_dir: str, expand_nested: bool) -> Optional[Iterator]:
+    """
+    Processa um ficheiro não comprimido diretamente em bytes, se possível.
+    
+    O ficheiro é mapeado em memória (mmap) e percorrido em bytes, saltando
+    de marcador #EXTINF: em marcador (_TRACK_RE). Só os bytes do último
+    diretório e do nome do ficheiro de cada track são descodificados, o que
+    evita descodificar e copiar o resto do ficheiro (títulos, metadados...).
+    O resultado é idêntico ao do processamento em texto (_iter_entries).
+    
+    Args:
+        file_path (str): Caminho do ficheiro regular (não comprimido; um
+            pipe teria sempre tamanho 0, ver _is_regular_file)
+        base_dir (str): Diretório usado para resolver referências relativas
+        expand_nested (bool): Se True, gera referências a sub-playlists
+        
+    Returns:
+        Optional[Iterator]: Gerador das entradas (ver _read_entries), ou
+            None se o ficheiro precisar do processamento em texto
+            (quebras de linha só com "\\r" ou referências a sub-playlists)
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return iter(())
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    # Quebras de linha só com "\r" exigem o processamento em texto
+    # (universal newlines); referências a sub-playlists podem estar em
+    # qualquer linha e não apenas a seguir a #EXTINF:
+    if (
+        _LONE_CR_RE.search(data)
+        or (expand_nested and _PLAYLIST_REFERENCE_RE.search(data))
+    ):
+        data.close()
+        return None
+    
+    return _scan_entries(data, _scan_encoding(data))
+
+
+def _scan_encoding(data: mmap.mmap) -> str:
+    """
+    Determina o encoding de um ficheiro mapeado em memória.
+    
+    Devolve o mesmo encoding que a tentativa sucessiva de ENCODINGS:
+    UTF-8 se o conteúdo for UTF-8 válido; senão Windows-1252, exceto se
+    contiver bytes que não existem em Windows-1252 (Latin-1).
+    
+    Args:
+        data (mmap.mmap): Conteúdo do ficheiro
+        
+    Returns:
+        str: Encoding a usar
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for start in range(0, len(data), _CHUNK_SIZE):
+            chunk = data[start:start + _CHUNK_SIZE]
+            # Blocos só com ASCII são UTF-8 válido (se não houver
+            # uma sequência multibyte pendente do bloco anterior)
+            if chunk.isascii() and not decoder.getstate()[0]:
+                continue
+            decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    # 'utf-8-sig' nunca é escolhido aqui: aceita exatamente o mesmo que 'utf-8'
+    for byte in _CP1252_UNDEFINED:
+        if data.find(byte) != -1:
+            return 'latin-1'
+    return 'windows-1252'
+
+
+def _scan_entries(data: mmap.mmap, encoding: str) -> Iterator:
+    """
+    Gera as tracks de um ficheiro mapeado em memória (ver _scan_file).
+    
+    Cada procura (_TRACK_RE) encontra um marcador #EXTINF: e devolve a
+    linha não vazia seguinte, sem criar strings para as restantes linhas.
+    
+    Args:
+        data (mmap.mmap): Conteúdo do ficheiro (é fechado no fim)
+        encoding (str): Encoding do ficheiro (ver _scan_encoding)
+        
+    Yields:
+        Tuple[str, str]: Tuplas (folder, filename)
+    """
+    folders: Dict[bytes, str] = {}  # Pastas já descodificadas
+    search = _TRACK_RE.search
+    
+    # bytes.decode('windows-1252') passa pelo codec em Python (lento para
+    # muitas strings curtas); a tabela do charmap é usada diretamente.
+    # Os bytes não definidos nunca aparecem aqui (ver _scan_encoding)
+    table = bytes(range(256)).decode(encoding, 'replace') if encoding == 'windows-1252' else None
+    charmap_decode = codecs.charmap_decode
+    
+    with data:
+        size = len(data)
+        match = search(data)
+        
+        while match:
+            marker = match.start()
             
-            # Ignorar linhas vazias entre #EXTINF: e o caminho do ficheiro
-            while i < len(content) and not content[i].strip():
-                i += 1
+            # O marcador só conta no início da linha (após espaços em branco)
+            if marker and data[marker - 1] != 0x0a:  # 0x0a = "\n"
+                line_start = data.rfind(b'\n', 0, marker) + 1
+                if _strip_bytes(data[line_start:marker], encoding):
+                    match = search(data, marker + 8)
+                    continue
             
-            # Verificar se ainda há linhas para processar
-            if i < len(content):
-                file_path_line = content[i].strip()
+            # A linha não vazia a seguir a #EXTINF: é sempre consumida.
+            # _TRACK_RE salta as linhas vazias ASCII; as que só têm espaços
+            # não-ASCII (raras) são saltadas aqui
+            line = _strip_bytes(match.group(1), encoding)
+            line_end = match.end()
+            while not line and line_end < size:
+                next_end = data.find(b'\n', line_end + 1)
+                if next_end == -1:
+                    next_end = size
+                line = _strip_bytes(data[line_end + 1:next_end], encoding)
+                line_end = next_end
+            
+            # Só é um caminho válido se não começar com # (comentários ou metadados)
+            if line and line[0] != 0x23:  # 0x23 = "#"
+                # Remover aspas se o caminho estiver entre aspas
+                if line[0] == 0x22 and line[-1] == 0x22:  # 0x22 = '"'
+                    line = line[1:-1]
                 
-                # Verificar se é um caminho válido (não começa com #)
-                # Linhas que começam com # são comentários ou metadados
-                if file_path_line and not file_path_line.startswith('#'):
-                    # Extrair último diretório e nome do ficheiro
-                    folder, filename = extract_folder_and_filename(file_path_line)
-                    
-                    # Adicionar à lista apenas se ambos os valores forem válidos
-                    if folder and filename:
-                        tracks.append((folder, filename))
-        
-        # Avançar para a próxima linha
-        i += 1
-    
-    return tracks
+                # Separar diretório e ficheiro em bytes e descodificar só estes
+                folder, filename = _split_path_bytes(line)
+                if folder and filename:
+                    # As tracks de um álbum partilham a pasta: descodificar uma vez
+                    folder_str = folders.get(folder)
+                    if folder_str is None:
+                        folder_str = folders[folder] = (
+                            folder.decode(encoding) if table is None
+                            else charmap_decode(folder, 'strict', table)[0]
+                        )
+                    yield (folder_str, filename.decode(encoding) if table is None
+                           else charmap_decode(filename, 'strict', table)[0])
+            
+            match = search(data, line_end)
+
+
+def _split_path_bytes(path: bytes) -> Tuple[bytes, bytes]:
+    """
+    Extrai o último diretório e o nome do ficheiro de um caminho em bytes.
+    
+    Equivale a extract_folder_and_filename() (os.path.dirname/basename),
+    mas sem descodificar o caminho. Casos invulgares (separadores repetidos,
+    caminhos UNC ou com unidade sem separador em Windows) usam os.path.
+    
+    Args:
+        path (bytes): Caminho já sem espaços e sem aspas
+        
+    Returns:
+        Tuple[bytes, bytes]: (folder, filename) em bytes
+    """
+    # Em Windows, "\\" e "/" são ambos separadores (mesmo tamanho, pelo
+    # que as posições no caminho não mudam)
+    normalized = path.replace(b'\\', b'/') if _WINDOWS_PATHS else path
+    
+    head, _, filename = normalized.rpartition(b'/')
+    folder = head.rpartition(b'/')[2]
+    
+    # Em Windows, os dois primeiros caracteres podem ser a unidade ("C:")
+    # ou o início de um caminho UNC (\\servidor\partilha)
+    unusual = not folder or (_WINDOWS_PATHS and (
+        len(head) - len(folder) < 2 or normalized.startswith(b'//')
+    ))
+    if unusual and head:
+        directory = os.path.dirname(path)
+        return (os.path.basename(directory) if directory else b'', os.path.basename(path))
+    
+    return folder, filename
+
+
+def _strip_bytes(line: bytes, encoding: str) -> bytes:
+    """
+    Remove os espaços em branco no início/fim de uma linha em bytes.
+    
+    Equivale a line.decode(encoding).strip().encode(encoding): se, depois
+    de remover os espaços ASCII, a linha começar ou acabar com um byte que
+    possa ser um espaço em branco não-ASCII, a linha é descodificada.
+    
+    Args:
+        line (bytes): Linha (ou parte de linha) em bytes
+        encoding (str): Encoding do ficheiro
+        
+    Returns:
+        bytes: Linha sem espaços em branco no início/fim
+    """
+    line = line.strip()
+    if line and (line[0] >= 0x80 or line[-1] >= 0x80
+                 or 0x1c <= line[0] <= 0x1f or 0x1c <= line[-1] <= 0x1f):
+        line = line.decode(encoding).strip().encode(encoding)
+    return line
+
+
+def _is_regular_file(file_path: str) -> bool:
+    """
+    Verifica se um caminho é um ficheiro regular.
+    
+    Pipes, FIFOs e dispositivos (ex.: /dev/stdin ou <(...) na shell) só
+    podem ser lidos uma vez e têm sempre tamanho 0: não podem ser abertos
+    várias vezes (deteção da compressão e do encoding) nem mapeados em
+    memória.
+    
+    Args:
+        file_path (str): Caminho do ficheiro
+        
+    Returns:
+        bool: True se for um ficheiro regular
+        
+    Raises:
+        FileNotFoundError: Se o ficheiro não existir
+    """
+    return stat.S_ISREG(os.stat(file_path).st_mode)
+
+
+def reads_ahead(file_path: str, cancelled: Optional[Callable[[], bool]] = None) -> bool:
+    """
+    Verifica se iter_m3u8() tem de ler a playlist por completo antes da primeira track.
+    
+    É o caso dos arquivos .zip e das playlists que (possivelmente)
+    referenciam sub-playlists: toda a árvore de sub-playlists é lida antes
+    de gerar a primeira track (ver iter_m3u8). A verificação só procura
+    ".m3u" nos bytes do ficheiro, sem o descodificar.
+    
+    Args:
+        file_path (str): Caminho da playlist
+        cancelled (Callable[[], bool], optional): Função consultada entre
+            blocos de ficheiros comprimidos; se devolver True, a
+            verificação termina de imediato
+        
+    Returns:
+        bool: True se a playlist for lida por completo antecipadamente (ou
+            se a verificação for cancelada)
+        
+    Raises:
+        FileNotFoundError: Se o ficheiro não existir
+    """
+    # Pipes são sempre lidos em streaming
+    if not _is_regular_file(file_path):
+        return False
+    
+    compression = detect_compression(file_path)
+    if compression == 'zip':
+        return True
+    
+    if compression is None:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _PLAYLIST_REFERENCE_RE.search(data) is not None
+    
+    with _open_binary(file_path, compression) as stream:
+        tail = b''  # Fim do bloco anterior (".m3u" entre dois blocos)
+        for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b''):
+            if cancelled is not None and cancelled():
+                return True
+            if _PLAYLIST_REFERENCE_RE.search(tail + chunk):
+                return True
+            tail = chunk[-3:]
+    return False
+
+
+def detect_compression(file_path: str) -> Optional[str]:
+    """
+    Deteta se um ficheiro está comprimido, a partir dos primeiros bytes.
+    
+    A deteção não depende da extensão do ficheiro, pelo que um .m3u8
+    comprimido com outro nome também é reconhecido. Num pipe (ver
+    _is_regular_file), os bytes lidos são consumidos: use
+    _stream_compression() no stream aberto.
+    
+    Args:
+        file_path (str): Caminho do ficheiro
+        
+    Returns:
+        Optional[str]: 'gzip', 'xz', 'bzip2' ou 'zip', ou None se o
+            ficheiro não estiver comprimido
+            
+    Raises:
+        FileNotFoundError: Se o ficheiro não existir
+    """
+    with open(file_path, 'rb') as f:
+        header = f.read(6)
+    
+    return _compression_for_header(header)
+
+
+def _stream_compression(stream: BinaryIO) -> Optional[str]:
+    """
+    Deteta se um stream binário está comprimido, sem consumir os seus bytes.
+    
+    Os primeiros bytes são lidos com peek() (ex.: sys.stdin.buffer) ou, em
+    streams posicionáveis (ex.: io.BytesIO), lidos e devolvidos com seek().
+    Noutros streams, o conteúdo é tratado como não comprimido.
+    
+    Args:
+        stream (BinaryIO): Stream binário, na posição inicial da playlist
+        
+    Returns:
+        Optional[str]: Formato, como em detect_compression()
+    """
+    if hasattr(stream, 'peek'):
+        header = stream.peek(6)[:6]
+    elif stream.seekable():
+        position = stream.tell()
+        header = stream.read(6)
+        stream.seek(position)
+    else:
+        return None
+    
+    return _compression_for_header(header)
+
+
+def _compression_for_header(header: bytes) -> Optional[str]:
+    """
+    Identifica o formato de compressão a partir dos primeiros bytes.
+    
+    Args:
+        header (bytes): Primeiros bytes do conteúdo (pelo menos 6, se existirem)
+        
+    Returns:
+        Optional[str]: 'gzip', 'xz', 'bzip2' ou 'zip', ou None
+    """
+    for magic, compression in _MAGIC_BYTES:
+        if header.startswith(magic):
+            return compression
+    return None
+
+
+def _open_binary(file_path: Union[str, BinaryIO], compression: Optional[str]) -> BinaryIO:
+    """
+    Abre um ficheiro em modo binário, descomprimindo-o em streaming se necessário.
+    
+    Args:
+        file_path (str | BinaryIO): Caminho do ficheiro (texto simples, gzip,
+            xz ou bzip2), ou um stream binário já aberto
+        compression (Optional[str]): Formato devolvido por detect_compression()
+        
+    Returns:
+        BinaryIO: Stream binário com o conteúdo descomprimido (um stream já
+            aberto e não comprimido é devolvido tal como está)
+    """
+    # Os módulos de compressão só são importados quando são necessários
+    if compression == 'gzip':
+        import gzip
+        return gzip.open(file_path, 'rb')
+    if compression == 'xz':
+        import lzma
+        return lzma.open(file_path, 'rb')
+    if compression == 'bzip2':
+        import bz2
+        return bz2.open(file_path, 'rb')
+    if hasattr(file_path, 'read'):
+        return file_path
+    return open(file_path, 'rb')
+
+
+def _is_playlist_path(line: str) -> bool:
+    """
+    Verifica se uma linha de caminho referencia outra playlist.
+    
+    Args:
+        line (str): Linha de caminho (já sem espaços no início/fim)
+        
+    Returns:
+        bool: True se o caminho terminar numa extensão de playlist
+    """
+    return line.strip('"').lower().endswith(PLAYLIST_EXTENSIONS)
+
+
+def _resolve_reference(line: str, base_dir: str) -> str:
+    """
+    Resolve o caminho de uma sub-playlist referenciada numa playlist.
+    
+    Args:
+        line (str): Linha com o caminho da sub-playlist (pode estar entre aspas)
+        base_dir (str): Diretório da playlist que contém a referência
+        
+    Returns:
+        str: Caminho normalizado da sub-playlist (ver _playlist_key)
+    """
+    path = line.strip()
+    if path.startswith('"') and path.endswith('"'):
+        path = path[1:-1]
+    
+    # As playlists são normalmente criadas em Windows; noutros sistemas,
+    # converter os separadores "\" para que caminhos relativos funcionem
+    if os.sep == '/':
+        path = path.replace('\\', '/')
+    
+    return _playlist_key(os.path.join(base_dir, path))
+
+
+def _playlist_key(file_path: str) -> str:
+    """
+    Normaliza o caminho de uma playlist para uso na tabela de memoização.
+    
+    Args:
+        file_path (str): Caminho da playlist (absoluto ou relativo ao
+            diretório atual)
+        
+    Returns:
+        str: Caminho absoluto normalizado
+    """
+    return os.path.normcase(os.path.abspath(file_path))
+
+
+def _new_references(entries: list, memo: Dict[str, list]) -> List[str]:
+    """
+    Devolve as referências de uma lista de entradas ainda não lidas.
+    
+    Args:
+        entries (list): Entradas devolvidas por _read_entries()
+        memo (Dict[str, list]): Tabela de playlists já lidas
+        
+    Returns:
+        List[str]: Referências ainda não presentes em memo
+    """
+    return [
+        entry for entry in entries
+        if isinstance(entry, str) and entry not in memo
+    ]
+
+
+def _flatten(key: str, memo: Dict[str, list], stack: List[str]) -> Iterator:
+    """
+    Gera as tracks de uma playlist, expandindo as referências.
+    
+    Args:
+        key (str): Playlist a expandir (caminho normalizado)
+        memo (Dict[str, list]): Tabela com as entradas de todas as playlists
+        stack (List[str]): Playlists em expansão (para detetar ciclos)
+        
+    Yields:
+        Tuple[str, str]: Tuplas (folder, filename), pela ordem da playlist
+        
+    Raises:
+        ValueError: Se uma playlist se referenciar a si própria, direta ou
+            indiretamente
+    """
+    for entry in memo[key]:
+        if not isinstance(entry, str):
+            yield entry
+            continue
+        
+        if entry in stack:
+            cycle = " -> ".join(os.path.basename(path) for path in stack + [entry])
+            raise ValueError(f"Referência circular entre playlists: {cycle}")
+        
+        stack.append(entry)
+        yield from _flatten(entry, memo, stack)
+        stack.pop()
+
+
+def playlist_basename(file_path: str) -> str:
+    """
+    Devolve o nome de uma playlist sem extensão (incluindo a de compressão).
+    
+    Args:
+        file_path (str): Caminho da playlist
+        
+    Returns:
+        str: Nome do ficheiro sem extensão
+        
+    Exemplo:
+        >>> playlist_basename("O:\\Playlists\\sessao.m3u8.gz")
+        'sessao'
+    """
+    name = os.path.basename(file_path)
+    for extension in PLAYLIST_EXTENSIONS:
+        if name.lower().endswith(extension):
+            return name[:-len(extension)]
+    return os.path.splitext(name)[0]
 
 
 def extract_folder_and_filename(full_path: str) -> Tuple[str, str]:
@@ -0,0 +1,297 @@
+"""
+Playlists recentes e pré-processamento em segundo plano
+
+Este módulo guarda a lista das playlists abertas recentemente (num ficheiro
+JSON na pasta do utilizador) e pré-processa as mais recentes numa thread em
+segundo plano (PlaylistWarmer), para que, ao escolher uma delas na
+interface, as tracks estejam disponíveis de imediato.
+
+O pré-processamento é limitado em número de playlists e em número total de
+tracks guardadas (memória), e pode ser interrompido a qualquer momento
+(por exemplo, quando o utilizador inicia uma ação na interface).
+
+Exemplo:
+    >>> add_recent("O:\\Playlists\\sessao.m3u8")
+    >>> warmer = PlaylistWarmer()
+    >>> warmer.start(load_recent())
+    >>> result = warmer.get("O:\\Playlists\\sessao.m3u8")  # None se não estiver pronta
+    >>> tracks, stats = result
+
+Autor: Vinyl Playlist Parser
+Versão: 1.0
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from parser import iter_m3u8, reads_ahead
+from stats import LibraryStats
+
+
+# Ficheiro onde a lista de playlists recentes é guardada
+RECENT_FILE = os.path.join(os.path.expanduser("~"), ".m3u8_parser_recent.json")
+
+# Número máximo de playlists na lista de recentes
+MAX_RECENT = 10
+
+# Número de tracks lidas entre verificações do pedido de paragem
+_CHECK_INTERVAL = 1000
+
+
+def load_recent(recent_file: str = RECENT_FILE) -> List[str]:
+    """
+    Lê a lista de playlists recentes (a mais recente primeiro).
+
+    Um ficheiro inexistente ou inválido é tratado como lista vazia; as
+    playlists que já não existem são omitidas.
+
+    Args:
+        recent_file (str, optional): Ficheiro JSON da lista de recentes
+
+    Returns:
+        List[str]: Caminhos das playlists recentes
+    """
+    try:
+        with open(recent_file, 'r', encoding='utf-8') as f:
+            paths = json.load(f)
+    except (OSError, ValueError):
+        return []
+
+    if not isinstance(paths, list):
+        return []
+
+    return [
+        path for path in paths
+        if isinstance(path, str) and os.path.isfile(path)
+    ][:MAX_RECENT]
+
+
+def add_recent(file_path: str, recent_file: str = RECENT_FILE) -> List[str]:
+    """
+    Coloca uma playlist no topo da lista de recentes e guarda a lista.
+
+    Args:
+        file_path (str): Caminho da playlist aberta
+        recent_file (str, optional): Ficheiro JSON da lista de recentes
+
+    Returns:
+        List[str]: Lista de recentes atualizada
+    """
+    file_path = os.path.abspath(file_path)
+    key = _path_key(file_path)
+
+    paths = [file_path] + [
+        path for path in load_recent(recent_file)
+        if _path_key(path) != key
+    ]
+    paths = paths[:MAX_RECENT]
+
+    # Escrever num ficheiro temporário e substituir, para que uma
+    # interrupção a meio não deixe a lista corrompida
+    temp_file = f"{recent_file}.tmp"
+    try:
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(paths, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, recent_file)
+    except OSError:
+        # Não conseguir guardar a lista não impede a utilização da aplicação
+        pass
+
+    return paths
+
+
+def _path_key(file_path: str) -> str:
+    """
+    Normaliza o caminho de uma playlist (para comparar e indexar a cache).
+
+    Args:
+        file_path (str): Caminho da playlist
+
+    Returns:
+        str: Caminho absoluto normalizado
+    """
+    return os.path.normcase(os.path.abspath(file_path))
+
+
+def _file_signature(file_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Devolve a data de modificação e o tamanho de um ficheiro.
+
+    Args:
+        file_path (str): Caminho do ficheiro
+
+    Returns:
+        Optional[Tuple[int, int]]: (mtime em ns, tamanho), ou None se o
+            ficheiro não existir
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class PlaylistWarmer:
+    """
+    Pré-processa playlists numa thread em segundo plano.
+
+    As playlists são lidas por ordem (a mais recente primeiro) com
+    parser.iter_m3u8(); o pedido de paragem é verificado a cada
+    _CHECK_INTERVAL tracks, pelo que stop() interrompe a leitura em curso
+    quase de imediato. Uma playlist que não caiba no limite de tracks é
+    descartada. Playlists que referenciam sub-playlists (e arquivos .zip)
+    não são pré-processadas: seriam lidas por completo antes da primeira
+    track (ver parser.reads_ahead), sem limite de memória nem paragem. As tracks guardadas só são devolvidas se o ficheiro não
+    tiver sido modificado desde a leitura (data de modificação e tamanho;
+    alterações em sub-playlists não são detetadas). As estatísticas de cada
+    playlist (ver stats.py) são acumuladas na mesma leitura.
+
+    Atributos:
+        max_playlists (int): Número máximo de playlists pré-processadas
+        max_tracks (int): Número máximo de tracks guardadas no total
+    """
+
+    def __init__(self, max_playlists: int = 3, max_tracks: int = 200_000):
+        """
+        Inicializa o pré-processamento (sem iniciar a thread).
+
+        Args:
+            max_playlists (int, optional): Número máximo de playlists
+                pré-processadas
+            max_tracks (int, optional): Número máximo de tracks guardadas
+                no total (limita a memória usada)
+        """
+        self.max_playlists = max_playlists
+        self.max_tracks = max_tracks
+
+        # Cache: caminho normalizado -> (assinatura do ficheiro, (tracks, estatísticas))
+        self._cache: Dict[str, Tuple[Tuple[int, int], Tuple[list, LibraryStats]]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, file_paths: Iterable[str]) -> None:
+        """
+        Inicia o pré-processamento das primeiras playlists indicadas.
+
+        Args:
+            file_paths (Iterable[str]): Playlists, por ordem de prioridade
+        """
+        self.stop()
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(list(file_paths)[:self.max_playlists], self._stop_event),
+            name="PlaylistWarmer",
+            daemon=True  # Não impede o fecho da aplicação
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Pede a paragem do pré-processamento, sem esperar pela thread.
+
+        As playlists já lidas continuam disponíveis em get().
+        """
+        self._stop_event.set()
+
+    def get(self, file_path: str) -> Optional[Tuple[List[Tuple[str, str]], LibraryStats]]:
+        """
+        Devolve as tracks pré-processadas de uma playlist, se existirem.
+
+        Args:
+            file_path (str): Caminho da playlist
+
+        Returns:
+            Optional[Tuple[List[Tuple[str, str]], LibraryStats]]: Tracks (a
+                lista não deve ser modificada) e as suas estatísticas, ou
+                None se a playlist não foi pré-processada ou foi modificada
+                entretanto
+        """
+        key = _path_key(file_path)
+        with self._lock:
+            entry = self._cache.get(key)
+
+        if entry is None:
+            return None
+
+        signature, result = entry
+        if signature != _file_signature(file_path):
+            # Ficheiro modificado: descartar a versão guardada
+            with self._lock:
+                self._cache.pop(key, None)
+            return None
+
+        return result
+
+    def _run(self, file_paths: List[str], stop_event: threading.Event) -> None:
+        """
+        Corpo da thread: lê as playlists enquanto não houver pedido de paragem.
+
+        Args:
+            file_paths (List[str]): Playlists a pré-processar
+            stop_event (threading.Event): Pedido de paragem desta execução
+        """
+        for file_path in file_paths:
+            if stop_event.is_set():
+                return
+
+            key = _path_key(file_path)
+            signature = _file_signature(file_path)
+            with self._lock:
+                cached = self._cache.get(key)
+                budget = self.max_tracks - sum(
+                    stats.track_count for _, (_, stats) in self._cache.values()
+                )
+
+            # Já pré-processada (e não modificada), ou ficheiro inexistente
+            if signature is None or (cached is not None and cached[0] == signature):
+                continue
+            
+            # Sub-playlists ou .zip: a leitura não poderia ser limitada nem interrompida
+            try:
+                if reads_ahead(file_path, stop_event.is_set):
+                    continue
+            except OSError:
+                continue
+
+            result = self._read(file_path, budget, stop_event)
+            if result is not None:
+                with self._lock:
+                    self._cache[key] = (signature, result)
+
+    @staticmethod
+    def _read(
+        file_path: str,
+        budget: int,
+        stop_event: threading.Event
+    ) -> Optional[Tuple[List[Tuple[str, str]], LibraryStats]]:
+        """
+        Lê uma playlist, desistindo se exceder o limite ou se for pedida a paragem.
+
+        Args:
+            file_path (str): Caminho da playlist
+            budget (int): Número máximo de tracks que ainda podem ser guardadas
+            stop_event (threading.Event): Pedido de paragem
+
+        Returns:
+            Optional[Tuple[List[Tuple[str, str]], LibraryStats]]: Tracks e
+                estatísticas, ou None se a leitura foi interrompida, excedeu
+                o limite ou falhou
+        """
+        tracks = []
+        stats = LibraryStats()
+        try:
+            for track in iter_m3u8(file_path, stats=stats):
+                tracks.append(track)
+                if len(tracks) % _CHECK_INTERVAL == 0 and stop_event.is_set():
+                    return None
+                if len(tracks) > budget:
+                    return None
+        except Exception:
+            # Erros de leitura são mostrados quando o utilizador abre a playlist
+            return None
+        return tracks, stats
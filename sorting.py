@@ -0,0 +1,102 @@
+"""
+Ordenação natural de tracks de vinil
+
+Este módulo ordena listas de tracks pela pasta do disco e, dentro de cada
+disco, pelo lado e posição da track (A1, A2, B1, AA1...). Os números são
+comparados pelo seu valor, pelo que "[K9]" vem antes de "[K089]" e "A2"
+vem antes de "A10".
+
+Desempenho:
+    A chave de ordenação é calculada uma única vez por track
+    (decorate-sort-undecorate, através do argumento ``key`` de sorted()).
+    A chave de cada pasta é calculada uma única vez por pasta distinta,
+    pelo que as tracks de um mesmo álbum a partilham em vez de a recalcular.
+
+Exemplo:
+    >>> natural_sort([("Album", "B1) Three.flac"), ("Album", "A2) Two.flac")])
+    [('Album', 'A2) Two.flac'), ('Album', 'B1) Three.flac')]
+
+Autor: Vinyl Playlist Parser
+Versão: 1.0
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+
+# Separa um texto em blocos de dígitos e de não-dígitos
+_DIGITS_RE = re.compile(r'(\d+)')
+
+# Lado e posição no início do nome do ficheiro: "A1)", "B12)", "AA1)"
+_SIDE_RE = re.compile(r'\s*([A-Za-z]{1,2})(\d+)\)\s*')
+
+
+def natural_key(text: str) -> tuple:
+    """
+    Calcula a chave de ordenação natural de um texto.
+
+    Ignora maiúsculas/minúsculas e converte os blocos de dígitos em inteiros,
+    de forma a que "K9" fique antes de "K089".
+
+    Args:
+        text (str): Texto a converter
+
+    Returns:
+        tuple: Chave alternando texto e números, começando sempre por texto
+
+    Exemplo:
+        >>> natural_key("Spiller [K089]")
+        ('spiller [k', 89, ']')
+    """
+    parts = _DIGITS_RE.split(text.casefold())
+    # Os índices ímpares são sempre blocos de dígitos
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
+
+
+def track_key(filename: str) -> tuple:
+    """
+    Calcula a chave de ordenação de um nome de ficheiro dentro de um disco.
+
+    Ficheiros com lado e posição ("A1) ...") são ordenados primeiro pelo
+    tamanho do lado (A, B... antes de AA, BB...), depois pela letra do lado
+    e pela posição numérica. Ficheiros sem essa indicação ficam no fim,
+    por ordem natural.
+
+    Args:
+        filename (str): Nome do ficheiro da track
+
+    Returns:
+        tuple: Chave de ordenação da track
+    """
+    match = _SIDE_RE.match(filename)
+    if match:
+        side, position = match.group(1).upper(), int(match.group(2))
+        return (0, len(side), side, position, natural_key(filename[match.end():]))
+    return (1, natural_key(filename))
+
+
+def natural_sort(tracks: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    Ordena tracks por pasta do disco e depois por lado/posição.
+
+    A ordenação é estável: tracks com chaves iguais mantêm a ordem original.
+
+    Args:
+        tracks (Iterable[Tuple[str, str]]): Tracks como (folder, filename)
+
+    Returns:
+        List[Tuple[str, str]]: Nova lista com as tracks ordenadas
+    """
+    tracks = list(tracks)
+
+    # As pastas distintas são ordenadas uma única vez; cada track usa depois
+    # apenas a posição (inteiro) da sua pasta, que é mais rápida de comparar
+    folder_ranks: Dict[str, int] = dict.fromkeys(folder for folder, _ in tracks)
+    for rank, folder in enumerate(sorted(folder_ranks, key=natural_key)):
+        folder_ranks[folder] = rank
+
+    def sort_key(track: Tuple[str, str]) -> tuple:
+        return (folder_ranks[track[0]], track_key(track[1]))
+
+    return sorted(tracks, key=sort_key)
@@ -0,0 +1,158 @@
+"""
+Estatísticas da coleção (discos, tracks e formatos)
+
+Este módulo acumula, track a track, um resumo da lista para impressão:
+número de discos (pastas distintas), tracks por disco, formatos dos
+ficheiros (.flac, .mp3...) e maiores/menores discos.
+
+Passagem única:
+    As estatísticas são acumuladas no mesmo ciclo que produz as tracks
+    (ver o parâmetro stats de parser.parse_m3u8, parser.iter_m3u8 e
+    merger.merge_playlists), sem percorrer a lista de novo. Os contadores
+    usam como chave a pasta e a extensão internadas (sys.intern), pelo que
+    as tracks de um disco partilham uma única string.
+
+Exemplo:
+    >>> stats = LibraryStats()
+    >>> tracks = parse_m3u8("playlist.m3u8", stats=stats)
+    >>> print(format_stats(stats))
+    >>> html = generate_html(tracks, "Minha Playlist", stats=stats)
+
+Autor: Vinyl Playlist Parser
+Versão: 1.0
+"""
+
+import sys
+from collections import Counter
+from heapq import nsmallest
+from typing import Iterable, Iterator, List, Tuple
+
+
+# Número de discos mostrados nas listas de maiores/menores discos
+TOP_RECORDS = 3
+
+# Nome mostrado para ficheiros sem extensão
+NO_EXTENSION = "(sem extensão)"
+
+
+class LibraryStats:
+    """
+    Contadores de discos, tracks e formatos, atualizados track a track.
+
+    Atributos:
+        track_count (int): Número total de tracks
+        tracks_per_record (Counter): Pasta (internada) -> número de tracks
+        formats (Counter): Extensão em minúsculas, sem ponto (internada)
+            -> número de tracks
+    """
+
+    def __init__(self):
+        """
+        Inicializa os contadores vazios.
+        """
+        self.track_count = 0
+        self.tracks_per_record: Counter = Counter()
+        self.formats: Counter = Counter()
+
+    def add(self, folder: str, filename: str) -> None:
+        """
+        Conta uma track.
+
+        Args:
+            folder (str): Nome do último diretório (o disco)
+            filename (str): Nome do ficheiro
+        """
+        self.track_count += 1
+        self.tracks_per_record[sys.intern(folder)] += 1
+
+        # Igual a os.path.splitext(): pontos no início do nome não contam
+        name, dot, extension = filename.rpartition('.')
+        if not dot or not extension or not name.lstrip('.'):
+            extension = NO_EXTENSION
+        self.formats[sys.intern(extension.lower())] += 1
+
+    def collect(self, tracks: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, str]]:
+        """
+        Gera as tracks recebidas, contando cada uma à passagem.
+
+        Args:
+            tracks (Iterable[Tuple[str, str]]): Tracks como (folder, filename)
+
+        Yields:
+            Tuple[str, str]: As mesmas tracks, pela mesma ordem
+        """
+        add = self.add
+        for track in tracks:
+            add(*track)
+            yield track
+
+    @property
+    def record_count(self) -> int:
+        """
+        int: Número de discos (pastas distintas).
+        """
+        return len(self.tracks_per_record)
+
+    @property
+    def average_tracks(self) -> float:
+        """
+        float: Média de tracks por disco (0 se não houver tracks).
+        """
+        if not self.tracks_per_record:
+            return 0.0
+        return self.track_count / len(self.tracks_per_record)
+
+    def largest_records(self, count: int = TOP_RECORDS) -> List[Tuple[str, int]]:
+        """
+        Devolve os discos com mais tracks (em empate, pela ordem da lista).
+
+        Args:
+            count (int, optional): Número de discos a devolver
+
+        Returns:
+            List[Tuple[str, int]]: Pares (pasta, número de tracks)
+        """
+        return self.tracks_per_record.most_common(count)
+
+    def smallest_records(self, count: int = TOP_RECORDS) -> List[Tuple[str, int]]:
+        """
+        Devolve os discos com menos tracks (em empate, pela ordem da lista).
+
+        Args:
+            count (int, optional): Número de discos a devolver
+
+        Returns:
+            List[Tuple[str, int]]: Pares (pasta, número de tracks)
+        """
+        return nsmallest(count, self.tracks_per_record.items(), key=lambda item: item[1])
+
+
+def format_stats(stats: LibraryStats) -> str:
+    """
+    Formata as estatísticas como texto (para o preview da interface).
+
+    Args:
+        stats (LibraryStats): Estatísticas acumuladas
+
+    Returns:
+        str: Texto do resumo, uma informação por linha
+    """
+    if not stats.track_count:
+        return "Sem tracks."
+
+    formats = ", ".join(
+        f"{extension} {count} ({count * 100 / stats.track_count:.0f}%)"
+        for extension, count in stats.formats.most_common()
+    )
+    lines = [
+        f"Discos: {stats.record_count}  |  Tracks: {stats.track_count}  |  "
+        f"Média: {stats.average_tracks:.1f} tracks por disco",
+        f"Formatos: {formats}",
+        "Maiores discos: " + ", ".join(
+            f"{folder} ({count})" for folder, count in stats.largest_records()
+        ),
+        "Menores discos: " + ", ".join(
+            f"{folder} ({count})" for folder, count in stats.smallest_records()
+        ),
+    ]
+    return "\n".join(lines)